@@ -0,0 +1,92 @@
+"""CSR path-enumeration kernel - pure integer DFS, JIT-compiled when Numba is available."""
+
+import numpy as np
+
+
+def _dfs_paths_core(indptr, indices, allowed, dist_tgt, src, tgt, max_depth):
+    """Enumerate simple paths src->tgt over a CSR graph with an edge mask.
+
+    Conditions are pre-folded into `allowed` (uint8 per edge), so the
+    loop is pure integer work: int32 path stack, per-depth edge cursors,
+    uint8 visited flags. Found paths concatenate into one flat int32
+    buffer (grown by doubling) with a parallel lengths array.
+
+    `dist_tgt` holds each node's hop distance to the target over allowed
+    edges; branches that cannot reach the target within the remaining
+    depth budget are cut without descending. An all-zeros array disables
+    the pruning.
+
+    Returns:
+        (flat_paths, path_lengths, pruned_count)
+    """
+    n = indptr.shape[0] - 1
+    visited = np.zeros(n, dtype=np.uint8)
+    path = np.empty(max_depth + 2, dtype=np.int32)
+    cursors = np.empty(max_depth + 2, dtype=np.int64)
+    out = np.empty(256, dtype=np.int32)
+    out_len = 0
+    lens = np.empty(64, dtype=np.int32)
+    n_paths = 0
+    pruned = 0
+
+    depth = 0
+    path[0] = src
+    visited[src] = 1
+    cursors[0] = indptr[src]
+
+    while depth >= 0:
+        u = path[depth]
+        k = cursors[depth]
+        end = indptr[u + 1]
+        descended = False
+        while k < end:
+            edge_k = k
+            v = indices[k]
+            k += 1
+            if visited[v] == 1:
+                continue
+            if allowed[edge_k] == 0:
+                pruned += 1
+                continue
+            if dist_tgt[v] > max_depth - depth - 1:
+                continue
+            if v == tgt:
+                plen = depth + 2
+                while out_len + plen > out.shape[0]:
+                    grown = np.empty(out.shape[0] * 2, dtype=np.int32)
+                    grown[:out_len] = out[:out_len]
+                    out = grown
+                if n_paths == lens.shape[0]:
+                    grown_lens = np.empty(lens.shape[0] * 2, dtype=np.int32)
+                    grown_lens[:n_paths] = lens[:n_paths]
+                    lens = grown_lens
+                for i in range(depth + 1):
+                    out[out_len + i] = path[i]
+                out[out_len + depth + 1] = tgt
+                out_len += plen
+                lens[n_paths] = plen
+                n_paths += 1
+            elif depth + 1 < max_depth:
+                cursors[depth] = k
+                depth += 1
+                path[depth] = v
+                visited[v] = 1
+                cursors[depth] = indptr[v]
+                descended = True
+                break
+        if not descended:
+            visited[path[depth]] = 0
+            depth -= 1
+
+    return out[:out_len], lens[:n_paths], pruned
+
+
+COMPILED = False
+try:
+    from numba import njit
+
+    _dfs_paths_core = njit(cache=True)(_dfs_paths_core)
+    COMPILED = True
+except ImportError:
+    # Numba is optional; the analyzer keeps its Python DFS without it
+    pass
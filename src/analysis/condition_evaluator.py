@@ -1,7 +1,214 @@
 import re
 import ipaddress
+import sys
+import types
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Dict, List, Union
 
+# Policy patterns can come from untrusted documents, and the stdlib
+# engine backtracks exponentially on pathological ones. Google's re2
+# guarantees linear-time matching via a DFA; it is optional, and the
+# wildcard translations below use only syntax both engines accept
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+
+@lru_cache(maxsize=1024)
+def _compile_wildcard(pattern: str) -> re.Pattern:
+    """Compile an IAM wildcard pattern (* and ?, literal dots) to a regex.
+
+    Policy patterns repeat across every edge evaluated during path
+    finding, so each distinct pattern is compiled once and the compiled
+    regex reused for every subsequent match.
+    """
+    return _re.compile(f"^{_wildcard_to_regex(pattern)}$")
+
+
+@lru_cache(maxsize=1024)
+def _compile_arn_pattern(pattern: str) -> re.Pattern:
+    """Compile an ARN wildcard pattern (* and ?) to a regex, cached."""
+    regex = pattern.replace("*", ".*").replace("?", ".")
+    return _re.compile(f"^{regex}$")
+
+
+@lru_cache(maxsize=1024)
+def _classify_simple_glob(pattern: str):
+    """Classify patterns with no '?' and at most one '*'.
+
+    Most policy wildcards look like "arn:aws:s3:::my-bucket/*" - a
+    literal, one star, a literal. Those match with two C-level
+    startswith/endswith calls, skipping the regex engine entirely.
+
+    Returns:
+        (pattern, None) for literal patterns, (prefix, suffix) for
+        single-star patterns, or None for anything needing a regex
+    """
+    if "?" in pattern:
+        return None
+    star_count = pattern.count("*")
+    if star_count == 0:
+        return (pattern, None)
+    if star_count == 1:
+        prefix, suffix = pattern.split("*")
+        return (prefix, suffix)
+    return None
+
+
+# Pattern lists above this size match per-pattern instead of compiling
+# one alternation regex, bounding compile cost on adversarial inputs
+_MAX_ALTERNATION = 64
+
+# Tally of matches that fell back to the backtracking regex engine
+# because the pattern was too complex for the startswith/endswith tier
+_glob_fallbacks = 0
+
+
+def _match_glob(value: str, pattern: str) -> bool:
+    """Match one wildcard pattern, via the simple fast path when possible."""
+    global _glob_fallbacks
+    simple = _classify_simple_glob(pattern)
+    if simple is not None:
+        prefix, suffix = simple
+        if suffix is None:
+            return value == prefix
+        return (len(value) >= len(prefix) + len(suffix)
+                and value.startswith(prefix) and value.endswith(suffix))
+    _glob_fallbacks += 1
+    return _compile_wildcard(pattern).match(value) is not None
+
+
+def _wildcard_to_regex(pattern: str) -> str:
+    """Translate one IAM wildcard pattern into a regex fragment."""
+    return pattern.replace(".", r"\.").replace("*", ".*").replace("?", ".")
+
+
+@lru_cache(maxsize=1024)
+def _compile_wildcard_alternation(patterns: tuple) -> re.Pattern:
+    """Compile a set of wildcard patterns into one alternation regex.
+
+    Matching a context value against a pattern list then costs a single
+    regex scan rather than one match attempt per pattern; callers pass
+    a sorted tuple so reordered lists share a cache entry.
+    """
+    return _re.compile("|".join(f"(?:{_wildcard_to_regex(p)})" for p in patterns))
+
+
+@lru_cache(maxsize=4096)
+def _parse_network(cidr: str):
+    """Parse a CIDR string to an ip_network, cached; None if invalid.
+
+    The same policy CIDRs are checked against thousands of edges, and
+    ip_network allocates and validates on every parse.
+    """
+    try:
+        return ipaddress.ip_network(cidr, strict=False)
+    except ValueError:
+        return None
+
+
+# Truthy tokens for the Bool operator; frozenset membership is a single
+# hash probe instead of a chain of string comparisons
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+@lru_cache(maxsize=1024)
+def _casefold(s: str) -> str:
+    """Casefold a string once per distinct value, cached.
+
+    Context values and policy allow-lists recur across evaluations, so
+    the case-insensitive comparisons below reuse one folded copy instead
+    of allocating a new lowercased string per call. casefold() rather
+    than lower() for Unicode-correct matching.
+    """
+    return s.casefold()
+
+
+@lru_cache(maxsize=4096)
+def _parse_condition_key(key: str):
+    """Split "Operator:context_key" once per distinct key, cached.
+
+    Keys without an operator default to StringEquals; malformed keys
+    (more than one colon) return (None, None). Both parts are interned
+    so the dispatch-table and context dict lookups that follow compare
+    pointers before falling back to character comparison.
+    """
+    parts = key.split(":")
+    if len(parts) == 2:
+        return sys.intern(parts[0]), sys.intern(parts[1])
+    if len(parts) == 1:
+        # Default to StringEquals if no operator specified
+        return "StringEquals", sys.intern(parts[0])
+    return None, None
+
+
+@lru_cache(maxsize=1024)
+def _parse_number_set(values: tuple):
+    """Parse a tuple of numeric policy values to a frozenset, cached.
+
+    Numeric allow-lists (ports, limits) are static per policy but were
+    re-parsed element by element on every check; the frozenset also
+    makes membership O(1). Returns None if any entry fails to parse.
+    """
+    try:
+        return frozenset(float(v) for v in values)
+    except (ValueError, TypeError):
+        return None
+
+
+def _freeze(value: Any):
+    """Convert a condition/context value into a hashable key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=64)
+def _key_index_for(keys: tuple) -> Dict[str, int]:
+    """Map a context key schema to dense value indices, shared per schema.
+
+    Contexts mostly share the same few keys and differ only in values,
+    so evaluators with the same key tuple share one index map and each
+    stores just a values tuple - the struct-of-arrays move in miniature.
+    """
+    return {k: i for i, k in enumerate(keys)}
+
+
+@lru_cache(maxsize=4096)
+def _parse_address(ip: str):
+    """Parse an IP string to an ip_address, cached; None if invalid."""
+    try:
+        return ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _cidr_to_int_mask(cidr: str):
+    """Reduce a CIDR to (network_int, netmask_int, version), cached.
+
+    Membership then costs one AND and one compare on plain ints instead
+    of an object-level ``ip in network`` check per evaluation.
+    Returns None if the CIDR doesn't parse.
+    """
+    network = _parse_network(cidr)
+    if network is None:
+        return None
+    return int(network.network_address), int(network.netmask), network.version
+
+
+@lru_cache(maxsize=4096)
+def _ip_to_int(ip: str):
+    """Reduce an IP string to (int_value, version), cached; None if invalid."""
+    addr = _parse_address(ip)
+    if addr is None:
+        return None
+    return int(addr), addr.version
+
 
 class ConditionEvaluator:
     """
@@ -25,92 +232,135 @@ class ConditionEvaluator:
                     "user_agent": "Chrome"
                 }
         """
-        self.context = context or {}
+        # Interned keys let every context lookup during evaluation hit
+        # the pointer-comparison fast path against the interned keys
+        # that _parse_condition_key produces
+        context = {sys.intern(k): v for k, v in (context or {}).items()}
+        # Read-only view: the evaluator (and its memoized results)
+        # assume the context never mutates, and the proxy enforces that
+        self.context = types.MappingProxyType(context)
+        # Dense value tuple plus a schema-shared key index; condition
+        # evaluation fetches values by tuple position instead of
+        # re-hashing the context dict on every lookup
+        self._ctx_index = _key_index_for(tuple(context))
+        self._ctx_values = tuple(context.values())
+        # Precomputed hashable identity for use as an external cache key;
+        # None when any value is unhashable-by-convention (nested dicts
+        # and lists don't belong in execution contexts anyway)
+        if all(isinstance(v, (str, int, float, type(None)))
+               for v in self.context.values()):
+            self._context_key = frozenset(self.context.items())
+        else:
+            self._context_key = None
+        # Bounded LRU over frozen condition dicts; the context is fixed
+        # per instance, so identical conditions re-checked across
+        # overlapping DFS subpaths short-circuit to a dict hit
+        self._result_cache: OrderedDict = OrderedDict()
+
+    _RESULT_CACHE_SIZE = 8192
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Return matcher statistics (cache fill and regex fallbacks)."""
+        return {
+            "result_cache_size": len(self._result_cache),
+            "glob_regex_fallbacks": _glob_fallbacks,
+        }
 
     def is_satisfied(self, condition: Union[Dict, None]) -> bool:
         """
         Evaluate if condition dict is satisfied under current context.
-        
+
         Args:
             condition: dict from IAM policy or None
-            
+
         Returns:
             True if ALL conditions hold, else False
         """
         if not condition:
             return True
-        
+
         if not isinstance(condition, dict):
             return False
 
+        cache = self._result_cache
+        try:
+            cache_key = _freeze(condition)
+            result = cache.get(cache_key)
+        except TypeError:
+            # Unhashable condition value; evaluate without caching
+            cache_key = None
+            result = None
+
+        if result is not None:
+            cache.move_to_end(cache_key)
+            return result
+
         # Each key in condition dict must be satisfied
+        result = all(
+            self._evaluate_condition_key(key, value)
+            for key, value in condition.items()
+        )
+
+        if cache_key is not None:
+            cache[cache_key] = result
+            if len(cache) > self._RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    def prepare(self, condition: Union[Dict, None]):
+        """Pre-resolve a condition into a zero-argument checker.
+
+        Key splitting, operator dispatch, and context-value resolution
+        happen once here; the returned closure re-runs only the operator
+        calls. Compile-once-evaluate-many for hot loops that re-check
+        the same condition under this evaluator's fixed context.
+
+        Returns:
+            A callable returning True if the condition holds
+        """
+        if not condition:
+            return lambda: True
+        if not isinstance(condition, dict):
+            return lambda: False
+
+        steps = []
         for key, value in condition.items():
-            if not self._evaluate_condition_key(key, value):
+            operator, context_key = _parse_condition_key(key)
+            handler = self._OPERATORS.get(operator) if operator else None
+            if handler is None:
+                return lambda: False
+            idx = self._ctx_index.get(context_key, -1)
+            context_value = self._ctx_values[idx] if idx >= 0 else None
+            steps.append((handler, context_value, value))
+
+        def check() -> bool:
+            try:
+                return all(handler(context_value, value)
+                           for handler, context_value, value in steps)
+            except Exception:
                 return False
 
-        return True
+        return check
 
     def _evaluate_condition_key(self, key: str, value: Any) -> bool:
         """Evaluate a single condition key-value pair."""
         try:
-            # Parse operator and context key: e.g., "StringEquals:source_ip"
-            parts = key.split(":")
-            if len(parts) == 2:
-                operator, context_key = parts
-            elif len(parts) == 1:
-                # Default to StringEquals if no operator specified
-                operator = "StringEquals"
-                context_key = parts[0]
-            else:
+            operator, context_key = _parse_condition_key(key)
+            if operator is None:
                 return False
-
-            context_value = self.context.get(context_key)
+            idx = self._ctx_index.get(context_key, -1)
+            context_value = self._ctx_values[idx] if idx >= 0 else None
             return self._apply_operator(operator, context_value, value)
         except Exception:
             return False
 
     def _apply_operator(self, operator: str, context_val: Any, policy_val: Any) -> bool:
-        """Apply specific operator logic."""
-        
-        if operator == "StringEquals":
-            return self._string_equals(context_val, policy_val)
-        elif operator == "StringNotEquals":
-            return not self._string_equals(context_val, policy_val)
-        elif operator == "StringEqualsIgnoreCase":
-            return self._string_equals_ignore_case(context_val, policy_val)
-        elif operator == "StringLike":
-            return self._string_like(context_val, policy_val)
-        elif operator == "StringNotLike":
-            return not self._string_like(context_val, policy_val)
-        elif operator == "IpAddress":
-            return self._ip_address_match(context_val, policy_val)
-        elif operator == "NotIpAddress":
-            return not self._ip_address_match(context_val, policy_val)
-        elif operator == "NumericEquals":
-            return self._numeric_equals(context_val, policy_val)
-        elif operator == "NumericNotEquals":
-            return not self._numeric_equals(context_val, policy_val)
-        elif operator == "NumericGreaterThan":
-            return self._numeric_greater_than(context_val, policy_val)
-        elif operator == "NumericGreaterThanEquals":
-            return self._numeric_greater_than(context_val, policy_val, equals=True)
-        elif operator == "NumericLessThan":
-            return self._numeric_less_than(context_val, policy_val)
-        elif operator == "NumericLessThanEquals":
-            return self._numeric_less_than(context_val, policy_val, equals=True)
-        elif operator == "NumericDateGreaterThan":
-            return self._date_greater_than(context_val, policy_val)
-        elif operator == "NumericDateLessThan":
-            return self._date_less_than(context_val, policy_val)
-        elif operator == "ArnLike":
-            return self._arn_like(context_val, policy_val)
-        elif operator == "ArnNotLike":
-            return not self._arn_like(context_val, policy_val)
-        elif operator == "Bool":
-            return self._bool_equals(context_val, policy_val)
-        else:
+        """Apply specific operator logic via the dispatch table."""
+        handler = self._OPERATORS.get(operator)
+        if handler is None:
             # Unknown operator defaults to False
             return False
+        return handler(context_val, policy_val)
 
     @staticmethod
     def _string_equals(context_val: Any, policy_val: Any) -> bool:
@@ -126,62 +376,67 @@ class ConditionEvaluator:
         """Check case-insensitive string equality."""
         if context_val is None:
             return False
+        context_ci = _casefold(str(context_val))
         if isinstance(policy_val, list):
-            context_lower = str(context_val).lower()
-            return context_lower in [str(v).lower() for v in policy_val]
-        return str(context_val).lower() == str(policy_val).lower()
+            return any(context_ci == _casefold(str(v)) for v in policy_val)
+        return context_ci == _casefold(str(policy_val))
 
     @staticmethod
     def _string_like(context_val: Any, policy_val: Any) -> bool:
         """Check string pattern match using wildcards (* and ?)."""
         if context_val is None:
             return False
-        
-        values = policy_val if isinstance(policy_val, list) else [policy_val]
+
         context_str = str(context_val)
-        
-        for val in values:
-            # Convert IAM wildcard pattern to regex
-            pattern = str(val).replace(".", r"\.").replace("*", ".*").replace("?", ".")
-            if re.match(f"^{pattern}$", context_str):
-                return True
-        return False
+        if isinstance(policy_val, list):
+            if not policy_val:
+                return False
+            if len(policy_val) > _MAX_ALTERNATION:
+                # Compiling a huge alternation can blow up; fall back to
+                # per-pattern matching, which still hits the fast paths
+                return any(_match_glob(context_str, str(v)) for v in policy_val)
+            # One alternation regex over the whole list: a single scan
+            # instead of k separate match attempts
+            patterns = tuple(sorted(str(v) for v in policy_val))
+            return _compile_wildcard_alternation(patterns).fullmatch(context_str) is not None
+        return _match_glob(context_str, str(policy_val))
 
     @staticmethod
     def _ip_address_match(context_val: Any, policy_val: Any) -> bool:
         """Check IP address match (supports CIDR notation)."""
         if context_val is None:
             return False
-        
-        try:
-            context_ip = ipaddress.ip_address(str(context_val))
-            values = policy_val if isinstance(policy_val, list) else [policy_val]
-            
-            for val in values:
-                try:
-                    # Try as CIDR range first
-                    if "/" in str(val):
-                        network = ipaddress.ip_network(str(val), strict=False)
-                        if context_ip in network:
-                            return True
-                    else:
-                        # Try as individual IP
-                        policy_ip = ipaddress.ip_address(str(val))
-                        if context_ip == policy_ip:
-                            return True
-                except ValueError:
-                    continue
-            return False
-        except (ValueError, TypeError):
+
+        context_ip = _ip_to_int(str(context_val))
+        if context_ip is None:
             return False
+        ip_int, ip_version = context_ip
+
+        values = policy_val if isinstance(policy_val, list) else [policy_val]
+        for val in values:
+            val_str = str(val)
+            # Try as CIDR range first: membership is a single mask-and-
+            # compare on the cached integer form
+            if "/" in val_str:
+                parsed = _cidr_to_int_mask(val_str)
+                if parsed is not None:
+                    net_int, mask, version = parsed
+                    if version == ip_version and (ip_int & mask) == net_int:
+                        return True
+            else:
+                # Try as individual IP
+                if _ip_to_int(val_str) == context_ip:
+                    return True
+        return False
 
     @staticmethod
     def _numeric_equals(context_val: Any, policy_val: Any) -> bool:
         """Check numeric equality."""
         try:
             context_num = float(context_val)
-            if isinstance(policy_val, list):
-                return context_num in [float(v) for v in policy_val]
+            if isinstance(policy_val, (list, tuple)):
+                parsed = _parse_number_set(tuple(policy_val))
+                return parsed is not None and context_num in parsed
             return context_num == float(policy_val)
         except (ValueError, TypeError):
             return False
@@ -235,8 +490,22 @@ class ConditionEvaluator:
         values = policy_val if isinstance(policy_val, list) else [policy_val]
         
         for val in values:
-            pattern = str(val).replace("*", ".*").replace("?", ".")
-            if re.match(f"^{pattern}$", context_str):
+            pattern = str(val)
+            # The ARN translation leaves '.' as regex any-char, so the
+            # startswith/endswith fast path only applies without dots
+            if "." not in pattern:
+                simple = _classify_simple_glob(pattern)
+                if simple is not None:
+                    prefix, suffix = simple
+                    if suffix is None:
+                        if context_str == prefix:
+                            return True
+                    elif (len(context_str) >= len(prefix) + len(suffix)
+                          and context_str.startswith(prefix)
+                          and context_str.endswith(suffix)):
+                        return True
+                    continue
+            if _compile_arn_pattern(pattern).match(context_str):
                 return True
         return False
 
@@ -244,8 +513,52 @@ class ConditionEvaluator:
     def _bool_equals(context_val: Any, policy_val: Any) -> bool:
         """Check boolean equality."""
         try:
-            context_bool = str(context_val).lower() in ("true", "1", "yes")
-            policy_bool = str(policy_val).lower() in ("true", "1", "yes")
-            return context_bool == policy_bool
+            return (str(context_val).lower() in _TRUTHY) == \
+                   (str(policy_val).lower() in _TRUTHY)
         except (ValueError, TypeError):
-            return False
\ No newline at end of file
+            return False
+
+
+@lru_cache(maxsize=64)
+def _evaluator_for(context_items: tuple) -> "ConditionEvaluator":
+    """One shared evaluator per distinct context (flyweight)."""
+    return ConditionEvaluator(dict(context_items))
+
+
+def get_evaluator(context: Dict[str, Any]) -> "ConditionEvaluator":
+    """Return a shared ConditionEvaluator for the given context.
+
+    Analyses are typically re-run many times under the same execution
+    context; sharing one evaluator per context keeps its memoized
+    condition results warm across analyzer instances. Contexts with
+    unhashable values fall back to a fresh instance.
+    """
+    try:
+        return _evaluator_for(tuple(sorted((context or {}).items())))
+    except TypeError:
+        return ConditionEvaluator(context)
+
+
+# Operator dispatch table: one dict lookup per condition key instead of
+# walking an if/elif chain of string comparisons. Built once at import,
+# after the class body so the staticmethods are plain callables.
+ConditionEvaluator._OPERATORS = {
+    "StringEquals": ConditionEvaluator._string_equals,
+    "StringNotEquals": lambda c, p: not ConditionEvaluator._string_equals(c, p),
+    "StringEqualsIgnoreCase": ConditionEvaluator._string_equals_ignore_case,
+    "StringLike": ConditionEvaluator._string_like,
+    "StringNotLike": lambda c, p: not ConditionEvaluator._string_like(c, p),
+    "IpAddress": ConditionEvaluator._ip_address_match,
+    "NotIpAddress": lambda c, p: not ConditionEvaluator._ip_address_match(c, p),
+    "NumericEquals": ConditionEvaluator._numeric_equals,
+    "NumericNotEquals": lambda c, p: not ConditionEvaluator._numeric_equals(c, p),
+    "NumericGreaterThan": ConditionEvaluator._numeric_greater_than,
+    "NumericGreaterThanEquals": lambda c, p: ConditionEvaluator._numeric_greater_than(c, p, equals=True),
+    "NumericLessThan": ConditionEvaluator._numeric_less_than,
+    "NumericLessThanEquals": lambda c, p: ConditionEvaluator._numeric_less_than(c, p, equals=True),
+    "NumericDateGreaterThan": ConditionEvaluator._date_greater_than,
+    "NumericDateLessThan": ConditionEvaluator._date_less_than,
+    "ArnLike": ConditionEvaluator._arn_like,
+    "ArnNotLike": lambda c, p: not ConditionEvaluator._arn_like(c, p),
+    "Bool": ConditionEvaluator._bool_equals,
+}
\ No newline at end of file
@@ -1,10 +1,15 @@
 import networkx as nx
+import numpy as np
 from src.graph.build_graph import build_graph
-from src.analysis.condition_evaluator import ConditionEvaluator
+from src.analysis import _dfs_kernel
+from src.analysis.condition_evaluator import get_evaluator
 from src.visualization import visualize_graph
 import argparse
+import json
 import logging
 import time
+from array import array
+from collections import OrderedDict
 from functools import lru_cache
 from typing import List, Tuple, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -14,24 +19,327 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Criticality bonus applied to the path target in score_path
+_CRIT_BONUS = {"critical": 40.0, "high": 30.0, "medium": 15.0}
+
+
+def _dfs_paths_ints(indptr, indices, allowed, dist_tgt, src_i, tgt_i, max_depth):
+    """Pure-integer explicit-stack DFS over a CSR graph with an edge mask.
+
+    Operates entirely on node indices so it can run against either the
+    analyzer's Python lists or shared-memory NumPy views in a worker
+    process. `dist_tgt` carries hop distances to the target for
+    cannot-reach pruning; all zeros disables it.
+    Returns (paths_as_index_lists, pruned_count).
+    """
+    valid_paths: List[List[int]] = []
+    pruned = 0
+    # Path membership lives in one big int: test is a shift-and-mask,
+    # push/pop are single C-level bit ops, no per-node hashing. The
+    # path and cursor stacks are preallocated to max_depth with an
+    # explicit top pointer, so the loop never grows a list.
+    visited_bits = 1 << src_i
+    path = array("i", bytes(4 * (max_depth + 1)))
+    cursors = array("q", bytes(8 * (max_depth + 1)))
+    top = 0
+    path[0] = src_i
+    cursors[0] = indptr[src_i]
+
+    while top >= 0:
+        u = path[top]
+        k = cursors[top]
+        end = indptr[u + 1]
+        descended = False
+        while k < end:
+            v_i = indices[k]
+            edge_k = k
+            k += 1
+            if (visited_bits >> v_i) & 1:
+                continue
+            # IAM edges with failing conditions were masked out up front
+            if not allowed[edge_k]:
+                pruned += 1
+                continue
+            # Too far from the target to finish within the depth budget
+            if dist_tgt[v_i] > max_depth - top - 1:
+                continue
+            if v_i == tgt_i:
+                valid_paths.append(
+                    [path[i] for i in range(top + 1)] + [tgt_i]
+                )
+            elif top + 1 < max_depth:
+                cursors[top] = k
+                visited_bits |= 1 << v_i
+                top += 1
+                path[top] = v_i
+                cursors[top] = indptr[v_i]
+                descended = True
+                break
+        if not descended:
+            visited_bits ^= 1 << path[top]
+            top -= 1
+
+    return valid_paths, pruned
+
+
+# Per-worker CSR views attached once by the pool initializer; queries
+# then reference the parent's shared-memory arrays with zero copying
+_worker_csr = None
+
+
+def _batch_worker_init(shm_names, lengths, max_depth):
+    """Attach this worker to the parent's shared-memory CSR arrays."""
+    global _worker_csr
+    from multiprocessing import shared_memory
+
+    shms = [shared_memory.SharedMemory(name=name) for name in shm_names]
+    indptr = np.ndarray(lengths[0], dtype=np.int64, buffer=shms[0].buf)
+    indices = np.ndarray(lengths[1], dtype=np.int32, buffer=shms[1].buf)
+    allowed = np.ndarray(lengths[2], dtype=np.uint8, buffer=shms[2].buf)
+    if not _dfs_kernel.COMPILED:
+        # The Python DFS fallback needs plain ints: NumPy int32 scalars
+        # overflow its visited-bitmap shifts for nodes >= 32 (same
+        # hazard tolist() guards against in from_csr). This copies the
+        # arrays once per worker, which only the fallback pays.
+        indptr = indptr.tolist()
+        indices = indices.tolist()
+        allowed = allowed.tobytes()
+    # Zero distances disable cannot-reach pruning in workers, which do
+    # not carry the parent's reverse CSR; results are unaffected
+    dist_tgt = np.zeros(max(lengths[0] - 1, 0), dtype=np.int32)
+    # The SharedMemory handles must stay referenced or the buffers close
+    _worker_csr = (indptr, indices, allowed, dist_tgt, max_depth, shms)
+
+
+def _batch_worker_query(pair):
+    """Run one (src, tgt) index query against the attached CSR."""
+    indptr, indices, allowed, dist_tgt, max_depth, _ = _worker_csr
+    src_i, tgt_i = pair
+    if _dfs_kernel.COMPILED:
+        flat, lens, pruned = _dfs_kernel._dfs_paths_core(
+            indptr, indices, allowed, dist_tgt, src_i, tgt_i, max_depth
+        )
+        paths = []
+        offset = 0
+        for plen in lens:
+            paths.append([int(i) for i in flat[offset:offset + plen]])
+            offset += plen
+        return paths, int(pruned)
+    return _dfs_paths_ints(indptr, indices, allowed, dist_tgt,
+                           src_i, tgt_i, max_depth)
+
 
 class AttackPathAnalyzer:
     """
     Discovers and analyzes security attack paths in a policy graph.
     Supports caching, performance metrics, and detailed explanations.
     """
+
+    _PATH_CACHE_SIZE = 128
     
     def __init__(self, graph: nx.DiGraph, context: Dict[str, Any], max_depth: int = 5):
         self.graph = graph
         self.context = context
         self.max_depth = max_depth
-        self.evaluator = ConditionEvaluator(context)
-        self._path_cache = {}
+        self.evaluator = get_evaluator(context)
+        # Bounded LRU keyed by (src, dst, depth) ints: repeated queries
+        # hit without re-running the DFS, and eviction of the least
+        # recently used entry keeps memory flat under many distinct pairs
+        self._path_cache: "OrderedDict[Tuple[int, int, int], List[List[str]]]" = OrderedDict()
+        self._metrics = {
+            "total_paths_found": 0,
+            "paths_pruned": 0,
+            "evaluation_time": 0.0
+        }
+        # Read-only CSR adjacency: node names map to dense ints once, and
+        # edges live in flat parallel arrays (destination, type, condition
+        # id) instead of NetworkX's nested dicts, so the DFS below walks
+        # contiguous memory. Identical condition dicts deduplicate into
+        # one shared entry in self._conditions (id 0 = no condition).
+        self._nodes = list(graph.nodes())
+        self._node_idx = {node: i for i, node in enumerate(self._nodes)}
+        indptr = [0]
+        indices: List[int] = []
+        edge_iam: List[bool] = []
+        cond_ids: List[int] = []
+        self._conditions: List[Any] = [None]
+        cond_index: Dict[str, int] = {}
+        # Scoring tables built alongside the CSR: per-target criticality
+        # bonus and per-edge risk contribution, so score_path never
+        # touches NetworkX attribute dicts
+        self._crit_bonus = np.array(
+            [_CRIT_BONUS.get(graph.nodes[n].get("criticality", "normal"), 0.0)
+             for n in self._nodes],
+            dtype=np.float32,
+        )
+        self._pair_score: Dict[Tuple[int, int], float] = {}
+        for u in self._nodes:
+            u_i = self._node_idx[u]
+            for v, data in graph.adj[u].items():
+                indices.append(self._node_idx[v])
+                is_iam = data.get("type") == "iam"
+                edge_iam.append(is_iam)
+                condition = data.get("condition") if is_iam else None
+                if is_iam:
+                    # IAM misconfigurations worth more risk points, and
+                    # bypassed conditions add difficulty on top
+                    self._pair_score[(u_i, self._node_idx[v])] = \
+                        5.0 + (3.0 if condition else 0.0)
+                if condition:
+                    cond_key = json.dumps(condition, sort_keys=True, default=str)
+                    cond_id = cond_index.get(cond_key)
+                    if cond_id is None:
+                        cond_id = len(self._conditions)
+                        self._conditions.append(condition)
+                        cond_index[cond_key] = cond_id
+                else:
+                    cond_id = 0
+                cond_ids.append(cond_id)
+            indptr.append(len(indices))
+        self._indptr = indptr
+        self._indices = indices
+        self._edge_iam = edge_iam
+        self._edge_cond_id = cond_ids
+        # Typed copies for the JIT kernel (no-ops to build when unused)
+        self._np_indptr = np.asarray(indptr, dtype=np.int64)
+        self._np_indices = np.asarray(indices, dtype=np.int32)
+        self._np_edge_iam = np.asarray(edge_iam, dtype=np.uint8)
+        self._np_cond_id = np.asarray(cond_ids, dtype=np.int32)
+        # The context is fixed for the analyzer's lifetime, so every
+        # deduplicated condition is evaluated exactly once here and
+        # folded into a per-edge allowed mask. The DFS inner loop then
+        # tests a single byte per edge instead of calling back into the
+        # evaluator; a new context means a new analyzer (and new mask).
+        cond_ok = np.empty(len(self._conditions), dtype=np.uint8)
+        cond_ok[0] = 1
+        for cond_id in range(1, len(self._conditions)):
+            cond_ok[cond_id] = self.evaluator.is_satisfied(self._conditions[cond_id])
+        self._np_allowed = np.where(
+            (self._np_edge_iam == 1) & (self._np_cond_id > 0),
+            cond_ok[self._np_cond_id],
+            np.uint8(1),
+        ).astype(np.uint8)
+        # Byte-string copy for the Python DFS: indexing yields plain ints
+        self._allowed = self._np_allowed.tobytes()
+        self._build_reverse_csr()
+
+    @classmethod
+    def from_csr(cls, nodes: List[str], indptr, indices,
+                 context: Dict[str, Any] = None, max_depth: int = 5) -> "AttackPathAnalyzer":
+        """
+        Build an analyzer directly from CSR adjacency, bypassing NetworkX.
+
+        NetworkX spends roughly a kilobyte of dict-of-dict overhead per
+        node, which caps how far benchmarks can scale; this constructor
+        accepts the flat arrays directly. All edges are treated as
+        unconditioned network edges. Path finding (single, raw, and
+        batch) works fully; explain_path and score_path read NetworkX
+        attributes and need a graph-backed analyzer.
+
+        Args:
+            nodes: Node names, in CSR row order
+            indptr: CSR row pointer array, length len(nodes) + 1
+            indices: CSR column indices (dense node ints)
+            context: Execution context for IAM conditions
+            max_depth: Maximum path depth
+
+        Returns:
+            AttackPathAnalyzer ready for queries
+        """
+        self = cls.__new__(cls)
+        self.graph = None
+        self.context = context or {}
+        self.max_depth = max_depth
+        self.evaluator = get_evaluator(self.context)
+        self._path_cache = OrderedDict()
         self._metrics = {
             "total_paths_found": 0,
             "paths_pruned": 0,
             "evaluation_time": 0.0
         }
+        self._nodes = list(nodes)
+        self._node_idx = {node: i for i, node in enumerate(self._nodes)}
+        # tolist() (not list()) so the Python DFS gets plain ints rather
+        # than fixed-width NumPy scalars, whose bit-shifts overflow
+        self._indptr = np.asarray(indptr).tolist()
+        self._indices = np.asarray(indices).tolist()
+        num_edges = len(self._indices)
+        self._edge_iam = [False] * num_edges
+        self._edge_cond_id = [0] * num_edges
+        self._conditions = [None]
+        self._crit_bonus = np.zeros(len(self._nodes), dtype=np.float32)
+        self._pair_score = {}
+        self._np_indptr = np.asarray(indptr, dtype=np.int64)
+        self._np_indices = np.asarray(indices, dtype=np.int32)
+        self._np_edge_iam = np.zeros(num_edges, dtype=np.uint8)
+        self._np_cond_id = np.zeros(num_edges, dtype=np.int32)
+        self._np_allowed = np.ones(num_edges, dtype=np.uint8)
+        self._allowed = self._np_allowed.tobytes()
+        self._build_reverse_csr()
+        return self
+
+    def _build_reverse_csr(self):
+        """Build the reverse CSR over allowed edges plus the distance cache.
+
+        Blocked edges are excluded so per-target distances reflect only
+        traversable structure.
+        """
+        indptr = self._indptr
+        indices = self._indices
+        n = len(self._nodes)
+        rcounts = [0] * (n + 1)
+        for u in range(n):
+            for k in range(indptr[u], indptr[u + 1]):
+                if self._allowed[k]:
+                    rcounts[indices[k] + 1] += 1
+        for i in range(1, n + 1):
+            rcounts[i] += rcounts[i - 1]
+        rindices = [0] * rcounts[n]
+        fill = list(rcounts)
+        for u in range(n):
+            for k in range(indptr[u], indptr[u + 1]):
+                if self._allowed[k]:
+                    v = indices[k]
+                    rindices[fill[v]] = u
+                    fill[v] += 1
+        self._rindptr = rcounts
+        self._rindices = rindices
+        # Distance-to-target arrays, computed once per distinct target
+        # and reused across queries (and across sources) to cut DFS
+        # branches that cannot reach the target in the remaining depth
+        self._target_dist_cache: Dict[int, np.ndarray] = {}
+
+    def _dist_to_target(self, tgt_i: int) -> np.ndarray:
+        """Hop distance from every node to the target over allowed edges.
+
+        One reverse BFS per distinct target, cached for the analyzer's
+        lifetime; unreachable nodes get a sentinel larger than any
+        possible depth budget so the DFS never descends toward them.
+        """
+        dist = self._target_dist_cache.get(tgt_i)
+        if dist is not None:
+            return dist
+
+        n = len(self._nodes)
+        dist = np.full(n, n + 1, dtype=np.int32)
+        dist[tgt_i] = 0
+        frontier = [tgt_i]
+        d = 0
+        rindptr = self._rindptr
+        rindices = self._rindices
+        while frontier:
+            d += 1
+            next_frontier = []
+            for v in frontier:
+                for k in range(rindptr[v], rindptr[v + 1]):
+                    u = rindices[k]
+                    if dist[u] > d:
+                        dist[u] = d
+                        next_frontier.append(u)
+            frontier = next_frontier
+
+        self._target_dist_cache[tgt_i] = dist
+        return dist
 
     def find_attack_paths(self, source: str, target: str, use_cache: bool = True) -> List[List[str]]:
         """
@@ -45,69 +353,206 @@ class AttackPathAnalyzer:
         Returns:
             List of valid attack paths (list of node lists)
         """
-        cache_key = (source, target)
-        if use_cache and cache_key in self._path_cache:
-            logger.info(f"Cache hit for {source} -> {target}")
-            return self._path_cache[cache_key]
+        src_i = self._node_idx.get(source)
+        tgt_i = self._node_idx.get(target)
+        cache_key = (src_i, tgt_i, self.max_depth)
+        if use_cache and src_i is not None and tgt_i is not None:
+            cached = self._path_cache.get(cache_key)
+            if cached is not None:
+                self._path_cache.move_to_end(cache_key)
+                logger.info(f"Cache hit for {source} -> {target}")
+                return cached
 
         start_time = time.time()
-        valid_paths = []
-        
+
         try:
             # Check if nodes exist
-            if source not in self.graph:
+            if src_i is None:
                 raise ValueError(f"Source node '{source}' not found in graph")
-            if target not in self.graph:
+            if tgt_i is None:
                 raise ValueError(f"Target node '{target}' not found in graph")
-            
-            # Find all simple paths up to max_depth
-            try:
-                all_paths = nx.all_simple_paths(
-                    self.graph, 
-                    source=source, 
-                    target=target, 
-                    cutoff=self.max_depth
-                )
-            except nx.NetworkXNoPath:
-                logger.warning(f"No path exists from {source} to {target}")
-                return []
-
-            # Validate each path
-            for path in all_paths:
-                if self._is_path_valid(path):
-                    valid_paths.append(path)
-                else:
-                    self._metrics["paths_pruned"] += 1
+
+            valid_paths = self._dfs_paths(source, target)
 
             self._metrics["total_paths_found"] += len(valid_paths)
             self._metrics["evaluation_time"] += time.time() - start_time
-            
+
             if use_cache:
                 self._path_cache[cache_key] = valid_paths
-            
+                if len(self._path_cache) > self._PATH_CACHE_SIZE:
+                    self._path_cache.popitem(last=False)
+
             return valid_paths
             
         except Exception as e:
             logger.error(f"Error finding attack paths: {e}")
             raise
 
-    def _is_path_valid(self, path: List[str]) -> bool:
-        """Check if a path is valid given execution context."""
-        for i in range(len(path) - 1):
-            src = path[i]
-            dst = path[i + 1]
-            edge_data = self.graph.get_edge_data(src, dst)
-            
-            if edge_data is None:
-                return False
-            
-            # For IAM edges, check conditions
-            if edge_data.get("type") == "iam":
-                condition = edge_data.get("condition")
-                if not self.evaluator.is_satisfied(condition):
-                    return False
-        
-        return True
+    def _dfs_paths(self, source: str, target: str) -> List[List[str]]:
+        """Enumerate valid simple paths with an explicit-stack DFS.
+
+        Conditions were pre-folded into the per-edge allowed mask at
+        construction, so a blocked edge prunes its whole subtree with a
+        single byte test. The visited bitmap and integer path stack
+        avoid per-step hashing entirely.
+        """
+        src_i = self._node_idx[source]
+        tgt_i = self._node_idx[target]
+
+        if _dfs_kernel.COMPILED:
+            return self._dfs_paths_jit(src_i, tgt_i, target)
+
+        int_paths, pruned = _dfs_paths_ints(
+            self._indptr, self._indices, self._allowed,
+            self._dist_to_target(tgt_i), src_i, tgt_i, self.max_depth,
+        )
+        self._metrics["paths_pruned"] += pruned
+        nodes = self._nodes
+        return [[nodes[i] for i in p] for p in int_paths]
+
+    def _dfs_paths_jit(self, src_i: int, tgt_i: int, target: str) -> List[List[str]]:
+        """Run the compiled CSR DFS kernel over the pre-folded edge mask.
+
+        The allowed mask was built at construction, so the kernel call
+        is pure integer work with no condition evaluation at all.
+        """
+        flat, lens, pruned = _dfs_kernel._dfs_paths_core(
+            self._np_indptr, self._np_indices, self._np_allowed,
+            self._dist_to_target(tgt_i), src_i, tgt_i, self.max_depth,
+        )
+        self._metrics["paths_pruned"] += int(pruned)
+
+        nodes = self._nodes
+        valid_paths: List[List[str]] = []
+        offset = 0
+        for plen in lens:
+            valid_paths.append([nodes[i] for i in flat[offset:offset + plen]])
+            offset += plen
+        return valid_paths
+
+    def find_attack_paths_raw(self, source: str, target: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find valid attack paths as a flat index buffer plus lengths.
+
+        Structure-of-arrays variant of find_attack_paths: paths come
+        back as one contiguous int32 buffer with a parallel lengths
+        array, with no per-path lists or name strings materialized.
+        Bulk consumers index self's node table lazily via decode_paths.
+
+        Args:
+            source: Starting node
+            target: Destination node
+
+        Returns:
+            (flat_indices, path_lengths) int32 arrays
+        """
+        src_i = self._node_idx.get(source)
+        tgt_i = self._node_idx.get(target)
+        if src_i is None:
+            raise ValueError(f"Source node '{source}' not found in graph")
+        if tgt_i is None:
+            raise ValueError(f"Target node '{target}' not found in graph")
+
+        start_time = time.time()
+        if _dfs_kernel.COMPILED:
+            flat, lens, pruned = _dfs_kernel._dfs_paths_core(
+                self._np_indptr, self._np_indices, self._np_allowed,
+                self._dist_to_target(tgt_i), src_i, tgt_i, self.max_depth,
+            )
+        else:
+            int_paths, pruned = _dfs_paths_ints(
+                self._indptr, self._indices, self._allowed,
+                self._dist_to_target(tgt_i), src_i, tgt_i, self.max_depth,
+            )
+            lens = np.fromiter((len(p) for p in int_paths),
+                               dtype=np.int32, count=len(int_paths))
+            flat = np.fromiter((i for p in int_paths for i in p),
+                               dtype=np.int32, count=int(lens.sum()))
+
+        self._metrics["paths_pruned"] += int(pruned)
+        self._metrics["total_paths_found"] += len(lens)
+        self._metrics["evaluation_time"] += time.time() - start_time
+        return flat, lens
+
+    def decode_paths(self, flat: np.ndarray, lens: np.ndarray) -> List[List[str]]:
+        """Materialize node-name paths from a raw (flat, lengths) pair."""
+        nodes = self._nodes
+        valid_paths: List[List[str]] = []
+        offset = 0
+        for plen in lens:
+            valid_paths.append([nodes[i] for i in flat[offset:offset + plen]])
+            offset += plen
+        return valid_paths
+
+    def find_attack_paths_batch(self, pairs: List[Tuple[str, str]],
+                                max_workers: int = None) -> Dict[Tuple[str, str], List[List[str]]]:
+        """
+        Run many independent (source, target) queries across a process pool.
+
+        Queries are read-only after graph load and embarrassingly
+        parallel; the CSR arrays are published once through
+        multiprocessing shared memory, so each worker attaches to the
+        same buffers instead of copying the graph. Workers exchange only
+        node indices - names are resolved back in this process.
+
+        Args:
+            pairs: List of (source, target) node name tuples
+            max_workers: Process count (defaults to the executor's choice)
+
+        Returns:
+            Dict mapping each (source, target) pair to its valid paths
+        """
+        # Validate against the index map, which both construction paths
+        # populate (self.graph is None for CSR-direct analyzers)
+        for source, target in pairs:
+            if source not in self._node_idx:
+                raise ValueError(f"Source node '{source}' not found in graph")
+            if target not in self._node_idx:
+                raise ValueError(f"Target node '{target}' not found in graph")
+
+        # Pool spin-up costs more than a couple of in-process queries
+        if len(pairs) <= 2:
+            return {
+                pair: self.find_attack_paths(pair[0], pair[1], use_cache=False)
+                for pair in pairs
+            }
+
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        start_time = time.time()
+        arrays = (self._np_indptr, self._np_indices, self._np_allowed)
+        shms = []
+        try:
+            for arr in arrays:
+                shm = shared_memory.SharedMemory(create=True,
+                                                 size=max(arr.nbytes, 1))
+                np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[:] = arr
+                shms.append(shm)
+
+            idx_pairs = [(self._node_idx[s], self._node_idx[t])
+                         for s, t in pairs]
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_batch_worker_init,
+                initargs=([shm.name for shm in shms],
+                          [len(arr) for arr in arrays],
+                          self.max_depth),
+            ) as pool:
+                worker_results = list(pool.map(_batch_worker_query, idx_pairs))
+        finally:
+            for shm in shms:
+                shm.close()
+                shm.unlink()
+
+        nodes = self._nodes
+        results: Dict[Tuple[str, str], List[List[str]]] = {}
+        for pair, (int_paths, pruned) in zip(pairs, worker_results):
+            results[pair] = [[nodes[i] for i in p] for p in int_paths]
+            self._metrics["paths_pruned"] += pruned
+            self._metrics["total_paths_found"] += len(int_paths)
+        self._metrics["evaluation_time"] += time.time() - start_time
+        return results
 
     def explain_path(self, path: List[str]) -> List[str]:
         """
@@ -171,52 +616,69 @@ class AttackPathAnalyzer:
         """
         if not path or len(path) < 2:
             return 0.0
-        
+
         score = 10.0  # Base score
-        
+
         # Factor 1: Path length (inversely related - shorter = direct = higher risk)
         # Max 25 points
-        path_length_score = max(0, 25 - (len(path) - 2) * 3)
-        score += path_length_score
-        
-        # Factor 2: Target criticality
-        target = path[-1]
-        target_data = self.graph.nodes.get(target, {})
-        criticality = target_data.get("criticality", "normal")
-        if criticality == "critical":
-            score += 40
-        elif criticality == "high":
-            score += 30
-        elif criticality == "medium":
-            score += 15
-        
-        # Factor 3: Edge types and conditions
-        iam_count = 0
-        network_count = 0
-        conditions_bypassed = 0
-        iam_complexity = 0
-        
-        for i in range(len(path) - 1):
-            src = path[i]
-            dst = path[i + 1]
-            edge_data = self.graph.get_edge_data(src, dst)
-            
-            if edge_data.get("type") == "iam":
-                iam_count += 1
-                # Check if conditions were present
-                if edge_data.get("condition"):
-                    conditions_bypassed += 1
-                    iam_complexity += 5  # More complex conditions = more risk to bypass
-            elif edge_data.get("type") == "network":
-                network_count += 1
-        
-        # IAM misconfigurations worth more risk points
-        score += iam_count * 5
-        score += conditions_bypassed * 3
-        
+        score += max(0, 25 - (len(path) - 2) * 3)
+
+        # Factor 2: Target criticality, from the precomputed bonus table
+        node_idx = self._node_idx
+        tgt_i = node_idx.get(path[-1], -1)
+        if tgt_i >= 0:
+            score += float(self._crit_bonus[tgt_i])
+
+        # Factor 3: Edge types and conditions, pre-folded into one risk
+        # contribution per (src, dst) pair at construction
+        pair_score = self._pair_score
+        idx = [node_idx.get(n, -1) for n in path]
+        score += sum(pair_score.get((idx[i], idx[i + 1]), 0.0)
+                     for i in range(len(idx) - 1))
+
         # Normalize to 0-100
         return min(100.0, score)
 
+    def score_paths(self, paths: List[List[str]]) -> np.ndarray:
+        """
+        Score many candidate paths in one call.
+
+        Length and criticality factors are computed as single vectorized
+        operations over the batch; only the per-edge sum walks each path,
+        and that against the precomputed pair-score table.
+
+        Args:
+            paths: List of paths (each a list of node names)
+
+        Returns:
+            float32 array of risk scores aligned with the input order
+        """
+        if not paths:
+            return np.empty(0, dtype=np.float32)
+
+        node_idx = self._node_idx
+        pair_score = self._pair_score
+
+        lengths = np.array([len(p) for p in paths], dtype=np.int64)
+        length_score = np.maximum(0, 25 - (lengths - 2) * 3)
+        targets = np.array(
+            [node_idx.get(p[-1], -1) if p else -1 for p in paths],
+            dtype=np.int64,
+        )
+        crit = np.where(targets >= 0,
+                        self._crit_bonus[np.maximum(targets, 0)], 0.0)
+        edge_sums = np.array(
+            [sum(pair_score.get((node_idx.get(p[i], -1),
+                                 node_idx.get(p[i + 1], -1)), 0.0)
+                 for i in range(len(p) - 1))
+             for p in paths],
+            dtype=np.float32,
+        )
+
+        scores = np.minimum(10.0 + length_score + crit + edge_sums, 100.0)
+        scores[lengths < 2] = 0.0
+        return scores.astype(np.float32)
+
     def get_metrics(self) -> Dict[str, Any]:
         """Return performance metrics."""
         return {
@@ -45,12 +45,12 @@ from src.graph.build_graph import build_graph
 from src.cloud_parsers import parse_cloud_policies
 from src.verification import Z3Verifier, VerificationResult, ProofResult
 from src.threat_scoring import (
-    CVSSCalculator,
     CVSSScore,
     ThreatAssessment,
     PathThreatScorer,
     PathThreatScore,
     ThreatLevel,
+    get_calculator,
 )
 
 logger = logging.getLogger(__name__)
@@ -1123,7 +1123,7 @@ async def calculate_cvss_score(request: CVSSVectorRequest):
         CVSS score and severity
     """
     try:
-        calculator = CVSSCalculator()
+        calculator = get_calculator()
         
         if request.vector_string:
             # Parse vector string
@@ -1,15 +1,41 @@
 import json
 import csv
+import hashlib
+import os
+import pickle
 import networkx as nx
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Optional C-accelerated JSON decoders. msgspec and orjson both decode
+# straight into Python objects considerably faster than the stdlib; the
+# loaders keep returning plain dicts either way.
+try:
+    import msgspec.json as _msgspec_json
+
+    def _decode_json(data: bytes) -> Any:
+        return _msgspec_json.decode(data)
+except ImportError:
+    try:
+        import orjson as _orjson
+
+        def _decode_json(data: bytes) -> Any:
+            return _orjson.loads(data)
+    except ImportError:
+        def _decode_json(data: bytes) -> Any:
+            return json.loads(data)
+
+
+# Directory for cached graph pickles (keyed by input-file signatures)
+GRAPH_CACHE_DIR = Path("cache")
+
+
 def load_assets(path: str) -> List[Dict[str, Any]]:
     """
     Load asset definitions from JSON file.
@@ -26,16 +52,16 @@ def load_assets(path: str) -> List[Dict[str, Any]]:
     """
     try:
         full_path = f"src/data/{path}"
-        with open(full_path, "r") as f:
-            data = json.load(f)
+        with open(full_path, "rb") as f:
+            data = _decode_json(f.read())
             assets = data.get("assets", [])
-            logger.info(f"Loaded {len(assets)} assets from {path}")
+            logger.info("Loaded %d assets from %s", len(assets), path)
             return assets
     except FileNotFoundError:
-        logger.error(f"Assets file not found: {full_path}")
+        logger.error("Assets file not found: %s", full_path)
         raise FileNotFoundError(f"Assets file not found: {full_path}")
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in assets file: {e}")
+    except ValueError as e:
+        logger.error("Invalid JSON in assets file: %s", e)
         raise ValueError(f"Invalid JSON in assets file: {e}")
 
 
@@ -56,23 +82,22 @@ def load_iam_policies(path: str) -> List[Dict[str, Any]]:
     try:
         policy_dir = Path(f"src/data/{path}")
         if not policy_dir.exists():
-            logger.warning(f"Policy directory not found: {policy_dir}")
+            logger.warning("Policy directory not found: %s", policy_dir)
             return []
         
         for file in policy_dir.glob("*.json"):
             try:
-                with open(file, "r") as f:
-                    policy = json.load(f)
+                with open(file, "rb") as f:
+                    policy = _decode_json(f.read())
                     policies.append(policy)
-                    logger.info(f"Loaded policy from {file.name}")
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in policy file {file.name}: {e}")
+            except ValueError as e:
+                logger.error("Invalid JSON in policy file %s: %s", file.name, e)
                 raise ValueError(f"Invalid JSON in policy file {file.name}: {e}")
         
-        logger.info(f"Loaded {len(policies)} policies from {path}")
+        logger.info("Loaded %d policies from %s", len(policies), path)
         return policies
     except Exception as e:
-        logger.error(f"Error loading IAM policies: {e}")
+        logger.error("Error loading IAM policies: %s", e)
         raise
 
 
@@ -101,27 +126,102 @@ def load_firewall_rules(path: str) -> List[Dict[str, str]]:
             for row in reader:
                 rules.append(row)
             
-            logger.info(f"Loaded {len(rules)} firewall rules from {path}")
+            logger.info("Loaded %d firewall rules from %s", len(rules), path)
             return rules
     except FileNotFoundError:
-        logger.error(f"Firewall rules file not found: {full_path}")
+        logger.error("Firewall rules file not found: %s", full_path)
         raise FileNotFoundError(f"Firewall rules file not found: {full_path}")
     except csv.Error as e:
-        logger.error(f"Invalid CSV in firewall rules file: {e}")
+        logger.error("Invalid CSV in firewall rules file: %s", e)
         raise ValueError(f"Invalid CSV in firewall rules file: {e}")
 
 
-def build_graph() -> nx.DiGraph:
+def _input_files() -> List[str]:
+    """List all data files that feed into graph construction."""
+    files = ["src/data/assets.json", "src/data/firewall_rules/rules.csv"]
+    policy_dir = Path("src/data/iam_policies")
+    if policy_dir.exists():
+        files.extend(str(f) for f in sorted(policy_dir.glob("*.json")))
+    return files
+
+
+def _input_signature() -> Optional[Tuple]:
+    """
+    Compute a signature of all input files as (path, mtime_ns, size) tuples.
+
+    Returns:
+        Signature tuple, or None if any input file cannot be stat'd
+    """
+    sig = []
+    try:
+        for path in _input_files():
+            stat = os.stat(path)
+            sig.append((path, stat.st_mtime_ns, stat.st_size))
+        return tuple(sig)
+    except OSError:
+        return None
+
+
+def _cache_path(sig: Tuple) -> Path:
+    """Get cache file path for an input signature."""
+    digest = hashlib.sha256(repr(sig).encode()).hexdigest()[:16]
+    return GRAPH_CACHE_DIR / f"graph_{digest}.pkl"
+
+
+def _load_cached_graph(sig: Tuple) -> Optional[nx.DiGraph]:
+    """Load cached graph for signature, or None on miss/corruption."""
+    cache_file = _cache_path(sig)
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, "rb") as f:
+            graph = pickle.load(f)
+        logger.info("Loaded cached graph from %s", cache_file)
+        return graph
+    except (pickle.PickleError, EOFError, OSError) as e:
+        logger.warning("Failed to load cached graph (%s), rebuilding", e)
+        return None
+
+
+def _save_cached_graph(sig: Tuple, graph: nx.DiGraph) -> None:
+    """Persist graph to cache; failures are non-fatal."""
+    try:
+        GRAPH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_cache_path(sig), "wb") as f:
+            pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning("Failed to persist graph cache: %s", e)
+
+
+def build_graph(use_cache: bool = True, minimal: bool = False) -> nx.DiGraph:
     """
     Build security graph from policy and asset definitions.
-    
+
     Graph contains:
     - Nodes: Assets (with type and criticality metadata)
     - Edges: Network rules (firewall) and IAM policies
-    
+
+    Results are cached to a pickle keyed by the (path, mtime, size) of all
+    input files, so repeated calls with unchanged data skip re-parsing.
+
+    Args:
+        use_cache: Whether to use the on-disk graph cache
+        minimal: Store only the attributes path analysis needs (type,
+            criticality, IAM condition), dropping descriptive metadata
+            like description/rule_name/protocol/port/policy_name. Shrinks
+            adjacency dicts substantially for traversal-heavy workloads.
+
     Returns:
         NetworkX DiGraph with security policies modeled as edges
     """
+    sig = _input_signature() if use_cache else None
+    if sig is not None:
+        # minimal graphs have different attributes, so key the cache on it too
+        sig = sig + (("minimal", minimal),)
+        cached = _load_cached_graph(sig)
+        if cached is not None:
+            return cached
+
     logger.info("Building security graph...")
     G = nx.DiGraph()
 
@@ -129,15 +229,22 @@ def build_graph() -> nx.DiGraph:
     try:
         assets = load_assets("assets.json")
         for asset in assets:
-            G.add_node(
-                asset["id"],
-                type=asset["type"],
-                criticality=asset.get("criticality", "normal"),
-                description=asset.get("description", "")
-            )
-        logger.info(f"Added {len(assets)} asset nodes to graph")
+            if minimal:
+                G.add_node(
+                    asset["id"],
+                    type=asset["type"],
+                    criticality=asset.get("criticality", "normal")
+                )
+            else:
+                G.add_node(
+                    asset["id"],
+                    type=asset["type"],
+                    criticality=asset.get("criticality", "normal"),
+                    description=asset.get("description", "")
+                )
+        logger.info("Added %d asset nodes to graph", len(assets))
     except Exception as e:
-        logger.error(f"Error loading assets: {e}")
+        logger.error("Error loading assets: %s", e)
         raise
     
     # Load and add network edges (firewall rules)
@@ -149,47 +256,118 @@ def build_graph() -> nx.DiGraph:
                 source = rule.get("source")
                 destination = rule.get("destination")
                 if source and destination:
-                    G.add_edge(
-                        source,
-                        destination,
-                        type="network",
-                        rule_name=rule.get("rule_name", "firewall_rule"),
-                        protocol=rule.get("protocol", "any"),
-                        port=rule.get("port", "any")
-                    )
+                    if minimal:
+                        G.add_edge(source, destination, type="network")
+                    else:
+                        G.add_edge(
+                            source,
+                            destination,
+                            type="network",
+                            rule_name=rule.get("rule_name", "firewall_rule"),
+                            protocol=rule.get("protocol", "any"),
+                            port=rule.get("port", "any")
+                        )
                     network_edge_count += 1
-        logger.info(f"Added {network_edge_count} network edges to graph")
+        logger.info("Added %d network edges to graph", network_edge_count)
     except Exception as e:
-        logger.error(f"Error loading firewall rules: {e}")
+        logger.error("Error loading firewall rules: %s", e)
         raise
     
     # Load and add IAM edges (identity & access management policies)
     try:
         iam_policies = load_iam_policies("iam_policies")
         iam_edge_count = 0
+        G_add_edge = G.add_edge  # avoid attribute lookup per edge
         for policy in iam_policies:
             if policy.get("Effect", "").lower() == "allow":
                 principal = policy.get("Principal")
                 resource = policy.get("Resource")
                 if principal and resource:
-                    G.add_edge(
-                        principal,
-                        resource,
-                        type="iam",
-                        action=",".join(policy.get("Action", [])) if isinstance(policy.get("Action"), list) else policy.get("Action", ""),
-                        condition=policy.get("Condition"),
-                        policy_name=policy.get("PolicyName", "default")
-                    )
+                    if minimal:
+                        # condition is kept: path validation depends on it
+                        G_add_edge(
+                            principal,
+                            resource,
+                            type="iam",
+                            condition=policy.get("Condition")
+                        )
+                    else:
+                        action_val = policy.get("Action")
+                        action_str = ",".join(action_val) if isinstance(action_val, list) else (action_val or "")
+                        G_add_edge(
+                            principal,
+                            resource,
+                            type="iam",
+                            action=action_str,
+                            condition=policy.get("Condition"),
+                            policy_name=policy.get("PolicyName", "default")
+                        )
                     iam_edge_count += 1
-        logger.info(f"Added {iam_edge_count} IAM edges to graph")
+        logger.info("Added %d IAM edges to graph", iam_edge_count)
     except Exception as e:
-        logger.error(f"Error loading IAM policies: {e}")
+        logger.error("Error loading IAM policies: %s", e)
         raise
     
-    logger.info(f"Graph construction complete: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+    logger.info("Graph construction complete: %d nodes, %d edges", G.number_of_nodes(), G.number_of_edges())
+
+    if sig is not None:
+        _save_cached_graph(sig, G)
+
     return G
 
 
+def to_igraph(G: nx.DiGraph):
+    """
+    Convert a NetworkX graph to an integer-indexed igraph.Graph.
+
+    NetworkX stores adjacency as dicts of dicts keyed by string IDs; igraph
+    uses compressed integer-indexed adjacency, which is much faster for
+    downstream traversal (path enumeration, threat scoring). Node names are
+    preserved in the igraph "name" vertex attribute so results can be mapped
+    back to asset IDs.
+
+    Args:
+        G: NetworkX DiGraph built by build_graph()
+
+    Returns:
+        igraph.Graph with integer vertex IDs and edge attributes carried over
+
+    Raises:
+        ImportError: If python-igraph is not installed
+    """
+    try:
+        import igraph as ig
+    except ImportError:
+        raise ImportError(
+            "python-igraph is required for to_igraph(); install with 'pip install python-igraph'"
+        )
+
+    nodes = list(G.nodes())
+    id_map = {n: i for i, n in enumerate(nodes)}
+
+    graph = ig.Graph(n=len(nodes), directed=True)
+    graph.vs["name"] = nodes
+    for attr in ("type", "criticality", "description"):
+        graph.vs[attr] = [G.nodes[n].get(attr) for n in nodes]
+
+    edges = []
+    edge_attrs: Dict[str, list] = {}
+    attr_keys = set()
+    edge_data = []
+    for u, v, d in G.edges(data=True):
+        edges.append((id_map[u], id_map[v]))
+        edge_data.append(d)
+        attr_keys.update(d)
+
+    graph.add_edges(edges)
+    for key in attr_keys:
+        edge_attrs[key] = [d.get(key) for d in edge_data]
+        graph.es[key] = edge_attrs[key]
+
+    logger.info("Converted graph to igraph: %d vertices, %d edges", graph.vcount(), graph.ecount())
+    return graph
+
+
 if __name__ == "__main__":
     graph = build_graph()
     print("\n" + "=" * 80)
@@ -4,7 +4,46 @@ Detects policy divergence between Azure and GCP normalized representations.
 
 This module provides a simple comparator API to be expanded with more heuristics.
 """
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, NamedTuple, Set, FrozenSet
+
+
+class PrincipalRole(NamedTuple):
+    """Principal-role pair used for cross-cloud assignment lookups.
+
+    Hashes identically to a plain tuple but is slot-backed (no per-instance
+    dict) and self-describing when mismatches surface in debugging.
+    """
+    principal: str
+    role: str
+
+
+class PermissionInterner:
+    """Map permission strings to small integer IDs for fast set operations.
+
+    Permission strings are short and highly repeated ("storageAccounts:read"),
+    so interning each unique string to an int once makes subsequent set
+    intersections/differences hash fixed-size ints instead of re-hashing the
+    string contents, and shrinks per-entry memory considerably.
+    """
+
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def intern(self, permission: str) -> int:
+        """Return the integer ID for a permission, assigning one if new."""
+        pid = self._ids.get(permission)
+        if pid is None:
+            pid = len(self._names)
+            self._ids[permission] = pid
+            self._names.append(permission)
+        return pid
+
+    def name(self, pid: int) -> str:
+        """Return the permission string for an interned ID."""
+        return self._names[pid]
 
 
 class MultiCloudComparator:
@@ -15,6 +54,9 @@ class MultiCloudComparator:
     - `compare_assignments(azure_assignments, gcp_bindings)` -> list of mismatches
     """
 
+    def __init__(self):
+        self._interner = PermissionInterner()
+
     def compare_roles(self, azure_roles: List[Dict[str, Any]], gcp_roles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Return a list of role comparison results.
 
@@ -44,26 +86,28 @@ class MultiCloudComparator:
     def compare_assignments(self, azure_assignments: List[Dict[str, Any]], gcp_bindings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compare principal-role mappings across clouds and report mismatches."""
         results = []
-        gcp_map = {(b.get("principal"), b.get("role")) for b in gcp_bindings}
+        gcp_map = frozenset(PrincipalRole(b.get("principal"), b.get("role")) for b in gcp_bindings)
         for a in azure_assignments:
             principal = a.get("principal")
             role = a.get("role_definition_id") or a.get("role")
-            if (principal, role) not in gcp_map:
+            if PrincipalRole(principal, role) not in gcp_map:
                 results.append({"principal": principal, "azure_role": role, "status": "missing-in-gcp"})
         return results
 
-    def _permission_set_from_azure(self, azure_role: Dict[str, Any]) -> Set[str]:
-        """Helper: flatten azure permission blocks into a set of normalized strings."""
-        perms = set()
-        for block in azure_role.get("permissions", []):
-            for a in block.get("actions", []) + block.get("dataActions", []):
-                # assume normalized already (e.g., storageAccounts:read)
-                perms.add(a)
-        return perms
+    def _permission_set_from_azure(self, azure_role: Dict[str, Any]) -> FrozenSet[int]:
+        """Helper: flatten azure permission blocks into a set of interned permission IDs."""
+        intern = self._interner.intern
+        return frozenset(
+            intern(a)
+            for block in azure_role.get("permissions", [])
+            # assume normalized already (e.g., storageAccounts:read)
+            for a in block.get("actions", []) + block.get("dataActions", [])
+        )
 
-    def _permission_set_from_gcp(self, gcp_role: Dict[str, Any]) -> Set[str]:
-        """Helper: flatten gcp role permissions into a set (identity normalization)."""
-        return set(gcp_role.get("permissions", []))
+    def _permission_set_from_gcp(self, gcp_role: Dict[str, Any]) -> FrozenSet[int]:
+        """Helper: flatten gcp role permissions into a set of interned permission IDs."""
+        intern = self._interner.intern
+        return frozenset(intern(p) for p in gcp_role.get("permissions", []))
 
     def compare_roles_detailed(self, azure_roles: List[Dict[str, Any]], gcp_roles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Return detailed role comparison with diff scores and severity.
@@ -83,9 +127,11 @@ class MultiCloudComparator:
             if match:
                 g_perms = self._permission_set_from_gcp(match)
             else:
-                g_perms = set()
-            missing = sorted(list(a_perms - g_perms))
-            extra = sorted(list(g_perms - a_perms))
+                g_perms = frozenset()
+            # decode interned IDs back to strings only for output
+            name = self._interner.name
+            missing = sorted(name(i) for i in a_perms - g_perms)
+            extra = sorted(name(i) for i in g_perms - a_perms)
             # divergence score: union size scaled by mismatch fraction
             union_len = len(a_perms | g_perms) or 1
             diff_len = len(missing) + len(extra)
@@ -131,4 +177,4 @@ class MultiCloudComparator:
         return results
 
 
-__all__ = ["MultiCloudComparator"]
+__all__ = ["MultiCloudComparator", "PermissionInterner", "PrincipalRole"]
@@ -1,14 +1,16 @@
 """Threat Scoring Module - CVSS calculation, CVE lookup, and threat assessment."""
 
-from .cvss_calculator import CVSSCalculator, CVSSScore, ThreatAssessment
-from .nvd_integration import NVDClient, CVERecord, VulnerabilityDatabase
+from .cvss_calculator import CVSSCalculator, CVSSScore, ThreatAssessment, get_calculator
+from .nvd_integration import NVDClient, AsyncNVDClient, CVERecord, VulnerabilityDatabase
 from .threat_scorer import PathThreatScorer, PathThreatScore, ThreatLevel
 
 __all__ = [
     "CVSSCalculator",
     "CVSSScore",
+    "get_calculator",
     "ThreatAssessment",
     "NVDClient",
+    "AsyncNVDClient",
     "CVERecord",
     "VulnerabilityDatabase",
     "PathThreatScorer",
@@ -0,0 +1,76 @@
+"""CVSS scoring kernel - pure-float arithmetic, JIT-compiled when Numba is available."""
+
+
+def _score_core(
+    av_w: float,
+    ac_w: float,
+    pr_w: float,
+    ui_w: float,
+    scope_is_changed: bool,
+    c_w: float,
+    i_w: float,
+    a_w: float,
+):
+    """
+    Compute (base_score, impact_score, exploitability) from resolved weights.
+
+    Pure floating-point CVSS v3.1 arithmetic with no dict or object access,
+    so Numba can compile it to machine code. The caller resolves metric
+    codes to weights and handles rounding/severity mapping.
+    """
+    impact = 1.0 - (1.0 - c_w) * (1.0 - i_w) * (1.0 - a_w)
+
+    if scope_is_changed:
+        impact_score = 7.52 * (impact - 0.029) - 3.25 * (impact - 0.02) ** 15
+    else:
+        impact_score = 6.42 * impact
+
+    if impact_score <= 0.0:
+        return 0.0, impact_score, 0.0
+
+    exploitability = 8.22 * av_w * ac_w * pr_w * ui_w
+    base_score = (impact_score + exploitability) * 0.9
+    if base_score > 10.0:
+        base_score = 10.0
+
+    return base_score, impact_score, exploitability
+
+
+def _score_batch_core(av_w, ac_w, pr_w, ui_w, scope_changed, c_w, i_w, a_w, out):
+    """
+    Score a whole batch of resolved weight arrays into `out`, rounded.
+
+    A single fused loop over contiguous float64 arrays: when Numba compiles
+    it, the batch scores in machine code with no intermediate temporaries,
+    which is the closest a pure-Python tree gets to a C extension. The
+    interpreted fallback exists only so the symbol is always importable;
+    callers should prefer NumPy expressions when Numba is absent.
+    """
+    for idx in range(out.shape[0]):
+        impact = 1.0 - (1.0 - c_w[idx]) * (1.0 - i_w[idx]) * (1.0 - a_w[idx])
+        if scope_changed[idx]:
+            impact_score = 7.52 * (impact - 0.029) - 3.25 * (impact - 0.02) ** 15
+        else:
+            impact_score = 6.42 * impact
+        if impact_score <= 0.0:
+            out[idx] = 0.0
+            continue
+        exploitability = 8.22 * av_w[idx] * ac_w[idx] * pr_w[idx] * ui_w[idx]
+        base = (impact_score + exploitability) * 0.9
+        if base > 10.0:
+            base = 10.0
+        out[idx] = round(base * 10.0) / 10.0
+
+
+# True when the kernels below are Numba-compiled machine code
+COMPILED = False
+
+try:
+    from numba import njit
+
+    _score_core = njit(cache=True, fastmath=False)(_score_core)
+    _score_batch_core = njit(cache=True, fastmath=False)(_score_batch_core)
+    COMPILED = True
+except ImportError:
+    # Numba is optional; the plain-Python kernels are used as-is
+    pass
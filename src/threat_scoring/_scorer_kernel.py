@@ -0,0 +1,63 @@
+"""Path threat-score kernels - scalar float arithmetic, JIT-compiled when Numba is available."""
+
+
+def _expl_core(is_exploitable: bool, path_length: float, has_auth_bypass: bool, has_privesc: bool) -> float:
+    """Exploitability score (0-10); see PathThreatScorer._calculate_exploitability."""
+    if not is_exploitable:
+        return 0.0
+    hops = (path_length - 1.0) * 0.5
+    score = 6.0 - (hops if hops > 0.0 else 0.0)
+    if score < 3.5:
+        score = 3.5
+    if has_auth_bypass:
+        score += 1.5
+    if has_privesc:
+        score += 1.0
+    if score > 10.0:
+        score = 10.0
+    return score
+
+
+def _impact_core(cvss_base_score: float, max_cve_score: float, cve_count: int) -> float:
+    """Impact score (0-10); see PathThreatScorer._calculate_impact."""
+    max_score = cvss_base_score if cvss_base_score > max_cve_score else max_cve_score
+    if max_score == 0.0:
+        max_score = 5.0
+    if cve_count > 0:
+        bonus = cve_count * 0.2
+        if bonus > 1.0:
+            bonus = 1.0
+        max_score += bonus
+        if max_score > 10.0:
+            max_score = 10.0
+    return max_score
+
+
+def _lineage_core(path_length: float) -> float:
+    """Lineage score (0-10); see PathThreatScorer._calculate_lineage_score."""
+    if path_length <= 3.0:
+        return 9.5 - (path_length - 1.0) * 0.5
+    if path_length <= 6.0:
+        return 7.0 - (path_length - 3.0) * 0.5
+    score = 6.0 - (path_length - 6.0) * 0.3
+    return score if score > 3.0 else 3.0
+
+
+def _confidence_core(z3_confidence: float, is_exploitable: bool) -> float:
+    """Confidence score (0-10); see PathThreatScorer._calculate_confidence."""
+    if not is_exploitable:
+        return 0.0
+    score = z3_confidence * 10.0
+    return score if score < 10.0 else 10.0
+
+
+try:
+    from numba import njit
+
+    _expl_core = njit(cache=True, fastmath=False)(_expl_core)
+    _impact_core = njit(cache=True, fastmath=False)(_impact_core)
+    _lineage_core = njit(cache=True, fastmath=False)(_lineage_core)
+    _confidence_core = njit(cache=True, fastmath=False)(_confidence_core)
+except ImportError:
+    # Numba is optional; the plain-Python kernels are used as-is
+    pass
@@ -1,13 +1,151 @@
 """CVSS v3.1 Score Calculator - Maps security vulnerabilities to common weakness enumeration metrics."""
 
+import bisect
+import functools
+import itertools
+import re
+import sys
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 import logging
 
+import numpy as np
+
+from . import _cvss_kernel
+from ._cvss_kernel import _score_core
+
 logger = logging.getLogger(__name__)
 
 
+# Flat metric weight tables, hoisted to module level so the scoring path
+# does a single direct subscript instead of nested dict traversal.
+_AV_W = {"N": 0.85, "A": 0.62, "L": 0.55, "P": 0.20}
+_AC_W = {"L": 0.77, "H": 0.44}
+_UI_W = {"N": 0.85, "R": 0.62}
+_IMPACT_W = {"N": 0.0, "L": 0.22, "H": 0.56}
+# PR weight depends on scope; flattened to a single (pr, scope)-keyed table
+_PR_W = {
+    ("N", "U"): 0.85, ("N", "C"): 0.85,
+    ("L", "U"): 0.68, ("L", "C"): 0.62,
+    ("H", "U"): 0.50, ("H", "C"): 0.27,
+}
+
+def _weight_lut(table: Dict[str, float]) -> np.ndarray:
+    """Build a codepoint-indexed weight lookup array for batch scoring."""
+    lut = np.full(128, np.nan)
+    for code, weight in table.items():
+        lut[ord(code)] = weight
+    return lut
+
+
+# Codepoint-indexed weight LUTs for the vectorized batch path
+_AV_LUT = _weight_lut(_AV_W)
+_AC_LUT = _weight_lut(_AC_W)
+_UI_LUT = _weight_lut(_UI_W)
+_IMPACT_LUT = _weight_lut(_IMPACT_W)
+_PR_LUT_U = _weight_lut({pr: w for (pr, s), w in _PR_W.items() if s == "U"})
+_PR_LUT_C = _weight_lut({pr: w for (pr, s), w in _PR_W.items() if s == "C"})
+
+
+# Severity bins: bisect_right into the thresholds indexes the name/color
+# tuples directly; a 0.0 score is special-cased to "None"/"gray"
+_SEV_THRESH = (4.0, 7.0, 9.0)
+_SEV_NAMES = ("Low", "Medium", "High", "Critical")
+_SEV_COLORS = ("yellow", "orange", "red", "darkred")
+
+
+# Canonically ordered full vector, matched in one pass by the C regex
+# engine; partial or reordered vectors fall through to the split parser
+_VEC_RE = re.compile(
+    r"AV:(?P<AV>[NALP])/AC:(?P<AC>[LH])/PR:(?P<PR>[NLH])/UI:(?P<UI>[NR])"
+    r"/S:(?P<S>[UC])/C:(?P<C>[NLH])/I:(?P<I>[NLH])/A:(?P<A>[NLH])\Z"
+)
+
+
+# Packed-vector layout: each metric occupies a 3-bit slice of a uint32
+# (24 bits total), with the value index taken from its canonical code
+# order. Packing an entire vector into one integer lets bulk stores keep
+# millions of vectors in a flat uint32 array and turns metric filtering
+# into branch-free mask-and-compare operations.
+_PACK_FIELDS: Dict[str, Tuple[int, Dict[str, int]]] = {
+    metric: (shift, {code: idx for idx, code in enumerate(codes)})
+    for metric, codes, shift in (
+        ("AV", "NALP", 0),
+        ("AC", "LH", 3),
+        ("PR", "NLH", 6),
+        ("UI", "NR", 9),
+        ("S", "UC", 12),
+        ("C", "NLH", 15),
+        ("I", "NLH", 18),
+        ("A", "NLH", 21),
+    )
+}
+
+
+def pack_vector(av: str, ac: str, pr: str, ui: str, scope: str, c: str, i: str, a: str) -> int:
+    """Pack eight CVSS metric codes into one 24-bit integer.
+
+    Raises:
+        KeyError: If any metric code is invalid
+    """
+    packed = 0
+    for metric, code in (("AV", av), ("AC", ac), ("PR", pr), ("UI", ui),
+                         ("S", scope), ("C", c), ("I", i), ("A", a)):
+        shift, codes = _PACK_FIELDS[metric]
+        packed |= codes[code] << shift
+    return packed
+
+
+def pack_vector_string(vector_string: str) -> Optional[int]:
+    """Pack a canonical CVSS v3 vector string, or None if it doesn't parse."""
+    if vector_string.startswith("CVSS:3.1/") or vector_string.startswith("CVSS:3.0/"):
+        vector_string = vector_string[9:]
+    m = _VEC_RE.match(vector_string)
+    if m is None:
+        return None
+    g = m.group
+    return pack_vector(g("AV"), g("AC"), g("PR"), g("UI"), g("S"), g("C"), g("I"), g("A"))
+
+
+def metric_mask(**metrics: str) -> Tuple[int, int]:
+    """Build a (mask, value) pair matching packed vectors by metric.
+
+    Example: ``mask, value = metric_mask(AV="N", C="H")`` selects network
+    vectors with high confidentiality impact via ``(arr & mask) == value``.
+
+    Raises:
+        KeyError: If a metric name or code is invalid
+    """
+    mask = 0
+    value = 0
+    for metric, code in metrics.items():
+        shift, codes = _PACK_FIELDS[metric]
+        mask |= 0b111 << shift
+        value |= codes[code] << shift
+    return mask, value
+
+
+def unpack_vector(packed: int) -> str:
+    """Rebuild the canonical vector string from a packed integer."""
+    parts = []
+    for metric, codes, shift in (
+        ("AV", "NALP", 0), ("AC", "LH", 3), ("PR", "NLH", 6), ("UI", "NR", 9),
+        ("S", "UC", 12), ("C", "NLH", 15), ("I", "NLH", 18), ("A", "NLH", 21),
+    ):
+        parts.append("%s:%s" % (metric, codes[(packed >> shift) & 0b111]))
+    return "/".join(parts)
+
+
+# Valid metric values for input validation
+_VALID_AV = frozenset("NALP")
+_VALID_AC = frozenset("LH")
+_VALID_PR = frozenset("NLH")
+_VALID_UI = frozenset("NR")
+_VALID_SCOPE = frozenset("UC")
+_VALID_IMPACT = frozenset("NLH")
+
+
 class CVSSScope(Enum):
     """CVSS Scope - whether vulnerability impact is limited to affected component."""
     UNCHANGED = "U"  # Impact limited to vulnerable component
@@ -40,9 +178,13 @@ class CVSSImpactType(Enum):
     HIGH = "H"        # Total information disclosure/total loss
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CVSSScore:
-    """CVSS v3.1 Score with vector string."""
+    """CVSS v3.1 Score with vector string.
+
+    Frozen and slot-backed: one instance exists per entry in the shared
+    score table and they are never mutated after construction.
+    """
     base_score: float
     temporal_score: float
     severity: str
@@ -55,34 +197,57 @@ class CVSSScore:
         score = self.base_score
         if score == 0.0:
             return "gray"
-        elif score < 4.0:
-            return "yellow"
-        elif score < 7.0:
-            return "orange"
-        elif score < 9.0:
-            return "red"
-        else:
-            return "darkred"
+        return _SEV_COLORS[bisect.bisect_right(_SEV_THRESH, score)]
 
     def __str__(self) -> str:
         return f"CVSS:3.1/{self.vector_string} Base:{self.base_score:.1f} Temporal:{self.temporal_score:.1f} ({self.severity})"
 
 
 class CVSSCalculator:
-    """CVSS v3.1 Base Score Calculator."""
+    """CVSS v3.1 Base Score Calculator.
 
-    # Metric weights for scoring
+    The eight base metrics admit only 2,592 combinations, so the full score
+    table is materialized once (shared across instances) and every scoring
+    call afterwards is a single dict lookup.
+    """
+
+    # Metric weights for scoring (kept for introspection; the scoring path
+    # uses the flat module-level tables directly)
     METRIC_WEIGHTS = {
-        "AV": {"N": 0.85, "A": 0.62, "L": 0.55, "P": 0.20},
-        "AC": {"L": 0.77, "H": 0.44},
+        "AV": _AV_W,
+        "AC": _AC_W,
         "PR": {"N": 0.85, "L": 0.62, "H": 0.27},
-        "UI": {"N": 0.85, "R": 0.62},
+        "UI": _UI_W,
         "S": {"U": 1.0, "C": 1.0},
-        "C": {"N": 0.0, "L": 0.22, "H": 0.56},
-        "I": {"N": 0.0, "L": 0.22, "H": 0.56},
-        "A": {"N": 0.0, "L": 0.22, "H": 0.56},
+        "C": _IMPACT_W,
+        "I": _IMPACT_W,
+        "A": _IMPACT_W,
     }
 
+    # Precomputed (av, ac, pr, ui, scope, c, i, a) -> CVSSScore table,
+    # built once on first instantiation and shared by all instances
+    _SCORE_TABLE: Optional[Dict[Tuple[str, ...], CVSSScore]] = None
+
+    def __init__(self):
+        if CVSSCalculator._SCORE_TABLE is None:
+            CVSSCalculator._SCORE_TABLE = self._build_score_table()
+        self._table = CVSSCalculator._SCORE_TABLE
+
+    def _build_score_table(self) -> Dict[Tuple[str, ...], CVSSScore]:
+        """Materialize scores for every valid metric combination."""
+        table = {}
+        impact_vals = ("N", "L", "H")
+        for combo in itertools.product(
+            ("N", "A", "L", "P"),  # AV
+            ("L", "H"),            # AC
+            ("N", "L", "H"),       # PR
+            ("N", "R"),            # UI
+            ("U", "C"),            # S
+            impact_vals, impact_vals, impact_vals,  # C, I, A
+        ):
+            table[combo] = self._compute_base_score(*combo)
+        return table
+
     def calculate_base_score(
         self,
         attack_vector: str = "N",  # Network
@@ -116,19 +281,36 @@ class CVSSCalculator:
             scope, confidentiality, integrity, availability
         )
 
-        # Calculate impact metrics
-        impact_confidentiality = self.METRIC_WEIGHTS["C"][confidentiality]
-        impact_integrity = self.METRIC_WEIGHTS["I"][integrity]
-        impact_availability = self.METRIC_WEIGHTS["A"][availability]
-
-        # Calculate impact (formula from CVSS v3.1 spec)
-        impact_score = 1 - ((1 - impact_confidentiality) * (1 - impact_integrity) * (1 - impact_availability))
+        return self._table[(
+            attack_vector, attack_complexity, privileges_required, user_interaction,
+            scope, confidentiality, integrity, availability
+        )]
 
-        # Scope impact multiplier
-        if scope == "C":
-            impact_score = 7.52 * (impact_score - 0.029) - 3.25 * ((impact_score - 0.02) ** 15)
-        else:
-            impact_score = 6.42 * impact_score
+    def _compute_base_score(
+        self,
+        attack_vector: str,
+        attack_complexity: str,
+        privileges_required: str,
+        user_interaction: str,
+        scope: str,
+        confidentiality: str,
+        integrity: str,
+        availability: str,
+    ) -> CVSSScore:
+        """Run the CVSS v3.1 arithmetic for one metric combination."""
+        # Resolve weights (validation already guarantees membership)
+        av_weight = _AV_W[attack_vector]
+        ac_weight = _AC_W[attack_complexity]
+        pr_weight = _PR_W[(privileges_required, scope)]
+        ui_weight = _UI_W[user_interaction]
+
+        # Pure-float CVSS v3.1 arithmetic lives in the (optionally
+        # Numba-compiled) kernel
+        base_score, impact_score, exploitability = _score_core(
+            av_weight, ac_weight, pr_weight, ui_weight,
+            scope == "C",
+            _IMPACT_W[confidentiality], _IMPACT_W[integrity], _IMPACT_W[availability],
+        )
 
         # If no impact, base score is 0
         if impact_score <= 0:
@@ -144,17 +326,6 @@ class CVSSCalculator:
                 details={"impact": 0.0, "exploitability": 0.0}
             )
 
-        # Calculate exploitability
-        av_weight = self.METRIC_WEIGHTS["AV"].get(attack_vector, 0.85)
-        ac_weight = self.METRIC_WEIGHTS["AC"].get(attack_complexity, 0.77)
-        pr_weight = self._get_pr_weight(privileges_required, scope)
-        ui_weight = self.METRIC_WEIGHTS["UI"].get(user_interaction, 0.85)
-
-        exploitability = 8.22 * av_weight * ac_weight * pr_weight * ui_weight
-
-        # Calculate base score
-        base_score = min(10.0, (impact_score + exploitability) * 0.9 if exploitability > 0 else impact_score)
-
         # Round to 1 decimal place
         base_score = round(base_score, 1)
 
@@ -185,6 +356,83 @@ class CVSSCalculator:
             }
         )
 
+    def calculate_base_scores_batch(
+        self,
+        attack_vector: Sequence[str],
+        attack_complexity: Sequence[str],
+        privileges_required: Sequence[str],
+        user_interaction: Sequence[str],
+        scope: Sequence[str],
+        confidentiality: Sequence[str],
+        integrity: Sequence[str],
+        availability: Sequence[str],
+    ) -> np.ndarray:
+        """
+        Calculate CVSS base scores for many vulnerabilities at once.
+
+        Each argument is a sequence of single-character metric codes (same
+        alphabet as calculate_base_score). The whole batch is computed with
+        element-wise NumPy operations rather than a Python loop per row.
+
+        Returns:
+            float array of rounded base scores, one per input row
+
+        Raises:
+            ValueError: If any metric code is invalid
+        """
+        def _codes(seq: Sequence[str]) -> np.ndarray:
+            arr = np.asarray(seq, dtype="U1")
+            # view the UCS4 storage as codepoints for LUT indexing
+            codes = arr.view(np.uint32).reshape(arr.shape[0], -1)[:, 0] if arr.size else arr.view(np.uint32)
+            # fold non-ASCII codepoints onto index 0, which is unset (NaN)
+            return np.where(codes < 128, codes, 0)
+
+        def _weights(seq: Sequence[str], lut: np.ndarray, metric: str) -> np.ndarray:
+            weights = lut[_codes(seq)]
+            if np.isnan(weights).any():
+                raise ValueError(f"Invalid {metric} code in batch")
+            return weights
+
+        c_w = _weights(confidentiality, _IMPACT_LUT, "C")
+        i_w = _weights(integrity, _IMPACT_LUT, "I")
+        a_w = _weights(availability, _IMPACT_LUT, "A")
+        av_w = _weights(attack_vector, _AV_LUT, "AV")
+        ac_w = _weights(attack_complexity, _AC_LUT, "AC")
+        ui_w = _weights(user_interaction, _UI_LUT, "UI")
+
+        scope_arr = np.asarray(scope, dtype="U1")
+        scope_changed = scope_arr == "C"
+        if not (scope_changed | (scope_arr == "U")).all():
+            raise ValueError("Invalid Scope code in batch")
+        pr_codes = _codes(privileges_required)
+        pr_w = np.where(scope_changed, _PR_LUT_C[pr_codes], _PR_LUT_U[pr_codes])
+        if np.isnan(pr_w).any():
+            raise ValueError("Invalid PR code in batch")
+
+        # Large batches go through the compiled kernel when available: one
+        # fused machine-code loop instead of several array temporaries
+        if _cvss_kernel.COMPILED and len(c_w) > 1000:
+            out = np.empty(len(c_w), dtype=np.float64)
+            _cvss_kernel._score_batch_core(
+                av_w, ac_w, pr_w, ui_w, scope_changed, c_w, i_w, a_w, out
+            )
+            return out
+
+        impact = 1.0 - (1.0 - c_w) * (1.0 - i_w) * (1.0 - a_w)
+        impact_score = np.where(
+            scope_changed,
+            7.52 * (impact - 0.029) - 3.25 * (impact - 0.02) ** 15,
+            6.42 * impact,
+        )
+
+        exploitability = 8.22 * av_w * ac_w * pr_w * ui_w
+        base = np.where(
+            impact_score <= 0.0,
+            0.0,
+            np.minimum(10.0, (impact_score + exploitability) * 0.9),
+        )
+        return np.round(base, 1)
+
     def calculate_from_vector(self, vector_string: str) -> CVSSScore:
         """
         Parse CVSS vector string and calculate score.
@@ -196,7 +444,24 @@ class CVSSCalculator:
             if vector_string.startswith("CVSS:3.1/"):
                 vector_string = vector_string[9:]
 
-            # Parse components
+            # Fast path: full 8-metric vectors in canonical order match a
+            # single precompiled regex - one C-engine pass extracts and
+            # validates every metric, no splits, no dict build
+            m = _VEC_RE.match(vector_string)
+            if m:
+                g = m.group
+                return self.calculate_base_score(
+                    attack_vector=g("AV"),
+                    attack_complexity=g("AC"),
+                    privileges_required=g("PR"),
+                    user_interaction=g("UI"),
+                    scope=g("S"),
+                    confidentiality=g("C"),
+                    integrity=g("I"),
+                    availability=g("A"),
+                )
+
+            # Fallback: tolerant split-based parse for partial vectors
             metrics = {}
             for component in vector_string.split("/"):
                 if ":" in component:
@@ -218,68 +483,58 @@ class CVSSCalculator:
             logger.error(f"Error parsing CVSS vector: {vector_string}: {e}")
             raise ValueError(f"Invalid CVSS vector: {vector_string}")
 
-    def _get_pr_weight(self, pr: str, scope: str) -> float:
-        """Get PR weight based on scope."""
-        if pr == "N":
-            return 0.85
-        elif pr == "L":
-            return 0.68 if scope == "U" else 0.62
-        elif pr == "H":
-            return 0.50 if scope == "U" else 0.27
-        else:
-            return 0.85
-
-    def _build_vector(
-        self, av, ac, pr, ui, scope, c, i, a
-    ) -> str:
-        """Build CVSS vector string."""
-        return f"AV:{av}/AC:{ac}/PR:{pr}/UI:{ui}/S:{scope}/C:{c}/I:{i}/A:{a}"
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _build_vector(av, ac, pr, ui, scope, c, i, a) -> str:
+        """Build CVSS vector string.
+
+        Cached and interned: only 2,592 distinct vectors exist, so repeated
+        calls reuse one shared string instead of re-formatting.
+        """
+        return sys.intern("AV:%s/AC:%s/PR:%s/UI:%s/S:%s/C:%s/I:%s/A:%s" % (av, ac, pr, ui, scope, c, i, a))
 
     def _score_to_severity(self, score: float) -> str:
         """Map score to severity rating."""
         if score == 0.0:
             return "None"
-        elif score < 4.0:
-            return "Low"
-        elif score < 7.0:
-            return "Medium"
-        elif score < 9.0:
-            return "High"
-        else:
-            return "Critical"
+        return _SEV_NAMES[bisect.bisect_right(_SEV_THRESH, score)]
 
     def _validate_inputs(self, av, ac, pr, ui, scope, c, i, a) -> None:
         """Validate CVSS metric inputs."""
-        valid_av = {"N", "A", "L", "P"}
-        valid_ac = {"L", "H"}
-        valid_pr = {"N", "L", "H"}
-        valid_ui = {"N", "R"}
-        valid_scope = {"U", "C"}
-        valid_impact = {"N", "L", "H"}
-
-        if av not in valid_av:
+        if av not in _VALID_AV:
             raise ValueError(f"Invalid AV: {av}")
-        if ac not in valid_ac:
+        if ac not in _VALID_AC:
             raise ValueError(f"Invalid AC: {ac}")
-        if pr not in valid_pr:
+        if pr not in _VALID_PR:
             raise ValueError(f"Invalid PR: {pr}")
-        if ui not in valid_ui:
+        if ui not in _VALID_UI:
             raise ValueError(f"Invalid UI: {ui}")
-        if scope not in valid_scope:
+        if scope not in _VALID_SCOPE:
             raise ValueError(f"Invalid Scope: {scope}")
-        if c not in valid_impact:
+        if c not in _VALID_IMPACT:
             raise ValueError(f"Invalid C: {c}")
-        if i not in valid_impact:
+        if i not in _VALID_IMPACT:
             raise ValueError(f"Invalid I: {i}")
-        if a not in valid_impact:
+        if a not in _VALID_IMPACT:
             raise ValueError(f"Invalid A: {a}")
 
 
+# Shared default calculator: stateless once the score table exists, so
+# every ThreatAssessment (and any per-request caller) can reuse one
+# instance instead of allocating its own
+_CALCULATOR = CVSSCalculator()
+
+
+def get_calculator() -> CVSSCalculator:
+    """Return the shared module-level CVSSCalculator instance."""
+    return _CALCULATOR
+
+
 class ThreatAssessment:
     """Assess threat level of attack path based on CVSS metrics."""
 
     def __init__(self):
-        self.calculator = CVSSCalculator()
+        self.calculator = _CALCULATOR
 
     def assess_attack_path(
         self,
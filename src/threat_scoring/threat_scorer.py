@@ -3,11 +3,38 @@
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 from enum import Enum
+import bisect
 import logging
+import math
+import sys
+
+import numpy as np
+
+from ._scorer_kernel import _confidence_core, _expl_core, _impact_core, _lineage_core
+
+# orjson serializes severalfold faster than stdlib json; fall back when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import json
 
 logger = logging.getLogger(__name__)
 
 
+# Recommendation targets and templates, bound once at import: membership
+# is an O(1) frozenset probe and fixed-text recommendations share one
+# string instead of re-allocating per scored path
+_SENSITIVE_TARGETS = frozenset({"database", "secrets", "admin"})
+_REC_NOT_EXPLOITABLE = "No immediate action required - path not exploitable."
+_REC_SEGMENT = "Consider network segmentation: Break path by isolating {node}"
+_REC_ACCESS = "Increase access controls on {target}: Implement MFA and least-privilege IAM"
+_REC_CVES = "Review {count} associated CVEs and apply patches"
+_REC_HIGH_CVSS = "High CVSS score detected - prioritize remediation"
+_REC_HARDENING = "Implement detective controls (CloudTrail, VPC Flow Logs)"
+
+
 class ThreatLevel(Enum):
     """Threat level classifications."""
     CRITICAL = "Critical"
@@ -19,19 +46,27 @@ class ThreatLevel(Enum):
     @property
     def score_range(self) -> Tuple[float, float]:
         """Get score range for this threat level."""
-        ranges = {
-            ThreatLevel.CRITICAL: (9.0, 10.0),
-            ThreatLevel.HIGH: (7.0, 8.9),
-            ThreatLevel.MEDIUM: (4.0, 6.9),
-            ThreatLevel.LOW: (0.1, 3.9),
-            ThreatLevel.INFORMATIONAL: (0.0, 0.0),
-        }
-        return ranges[self]
+        return _SCORE_RANGES[self]
+
 
+# Built once at import; the score_range property was re-allocating this
+# mapping on every access
+_SCORE_RANGES = {
+    ThreatLevel.CRITICAL: (9.0, 10.0),
+    ThreatLevel.HIGH: (7.0, 8.9),
+    ThreatLevel.MEDIUM: (4.0, 6.9),
+    ThreatLevel.LOW: (0.1, 3.9),
+    ThreatLevel.INFORMATIONAL: (0.0, 0.0),
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class ThreatScoreComponent:
-    """Individual component of threat score."""
+    """Individual component of threat score.
+
+    Slot-backed: four are allocated per scored path, so dropping the
+    per-instance ``__dict__`` matters at batch scale.
+    """
     name: str
     value: float
     weight: float
@@ -43,7 +78,7 @@ class ThreatScoreComponent:
         return self.value * self.weight
 
 
-@dataclass
+@dataclass(slots=True)
 class PathThreatScore:
     """Complete threat score for an attack path."""
     path_id: str
@@ -58,13 +93,29 @@ class PathThreatScore:
     cve_count: int = 0
     max_cve_score: Optional[float] = None
     recommendations: List[str] = field(default_factory=list)
+    # serialized forms, built on first to_dict and reused after
+    # (manual slot caches; cached_property needs a __dict__ that
+    # slots=True removes)
+    _components_dicts: Optional[List[Dict]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _as_dict: Optional[Dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __str__(self) -> str:
         return f"[{self.threat_level.value}] Path: {' → '.join(self.path)} Score: {self.overall_score:.1f}/10"
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
+        """Convert to dictionary for JSON serialization.
+
+        The dict is built once and reused; callers serializing the same
+        score repeatedly (e.g. per API request) pay only an attribute
+        load after the first call.
+        """
+        if self._as_dict is not None:
+            return self._as_dict
+        self._as_dict = {
             "path_id": self.path_id,
             "path": self.path,
             "overall_score": round(self.overall_score, 1),
@@ -75,7 +126,15 @@ class PathThreatScore:
             "confidence_score": round(self.confidence_score, 2),
             "cve_count": self.cve_count,
             "max_cve_score": round(self.max_cve_score, 1) if self.max_cve_score else None,
-            "components": [
+            "components": self._serialized_components(),
+            "recommendations": self.recommendations,
+        }
+        return self._as_dict
+
+    def _serialized_components(self) -> List[Dict]:
+        """Serialize components once and reuse on later to_dict calls."""
+        if self._components_dicts is None:
+            self._components_dicts = [
                 {
                     "name": c.name,
                     "value": round(c.value, 2),
@@ -84,9 +143,15 @@ class PathThreatScore:
                     "description": c.description,
                 }
                 for c in self.components
-            ],
-            "recommendations": self.recommendations,
-        }
+            ]
+        return self._components_dicts
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize directly to JSON bytes (orjson when installed)."""
+        payload = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload).encode("utf-8")
 
 
 class PathThreatScorer:
@@ -102,7 +167,9 @@ class PathThreatScorer:
 
     def __init__(self):
         """Initialize threat scorer."""
-        pass
+        # path tuple -> interned joined ID; re-scoring the same path reuses
+        # one shared string instead of re-joining per call
+        self._id_cache: Dict[Tuple[str, ...], str] = {}
 
     def score_path(
         self,
@@ -150,13 +217,20 @@ class PathThreatScorer:
         lineage = self._calculate_lineage_score(path)
         confidence = self._calculate_confidence(z3_confidence, is_exploitable)
 
-        # Calculate overall score
-        overall_score = (
-            exploitability * self.WEIGHTS["exploitability"] +
-            impact * self.WEIGHTS["impact"] +
-            lineage * self.WEIGHTS["lineage"] +
-            confidence * self.WEIGHTS["confidence"]
-        )
+        # Calculate overall score (weights read once into locals)
+        weights = self.WEIGHTS
+        w_expl = weights["exploitability"]
+        w_impact = weights["impact"]
+        w_lineage = weights["lineage"]
+        w_confidence = weights["confidence"]
+        # fsum keeps the weighted sum exactly rounded once instead of
+        # accumulating error across three separate additions
+        overall_score = math.fsum((
+            exploitability * w_expl,
+            impact * w_impact,
+            lineage * w_lineage,
+            confidence * w_confidence,
+        ))
 
         # Ensure score is between 0 and 10
         overall_score = min(10.0, max(0.0, overall_score))
@@ -174,25 +248,25 @@ class PathThreatScorer:
             ThreatScoreComponent(
                 name="Exploitability",
                 value=exploitability,
-                weight=self.WEIGHTS["exploitability"],
+                weight=w_expl,
                 description="Ease of exploitation based on path structure",
             ),
             ThreatScoreComponent(
                 name="Impact",
                 value=impact,
-                weight=self.WEIGHTS["impact"],
+                weight=w_impact,
                 description="Severity of impact if path is exploited",
             ),
             ThreatScoreComponent(
                 name="Lineage",
                 value=lineage,
-                weight=self.WEIGHTS["lineage"],
+                weight=w_lineage,
                 description="Attack path complexity and length",
             ),
             ThreatScoreComponent(
                 name="Confidence",
                 value=confidence,
-                weight=self.WEIGHTS["confidence"],
+                weight=w_confidence,
                 description="Confidence in Z3 verification result",
             ),
         ]
@@ -227,26 +301,7 @@ class PathThreatScorer:
         - How many steps required?
         - Are there auth bypass/privesc opportunities?
         """
-        if not is_exploitable:
-            return 0.0
-
-        # Base score for exploitable path
-        score = 6.0
-
-        # Reduce score based on path length (longer = more difficult)
-        # Each additional hop -0.5, min 3.5
-        score -= max(0.0, (path_length - 1) * 0.5)
-        score = max(3.5, score)
-
-        # Increase score for auth bypass
-        if has_auth_bypass:
-            score += 1.5
-
-        # Increase score for privilege escalation
-        if has_privesc:
-            score += 1.0
-
-        return min(10.0, score)
+        return _expl_core(is_exploitable, float(path_length), has_auth_bypass, has_privesc)
 
     def _calculate_impact(
         self,
@@ -262,20 +317,7 @@ class PathThreatScorer:
         - Maximum CVSS from associated CVEs
         - Number of related vulnerabilities
         """
-        # Use higher of CVSS or CVE score
-        max_score = max(cvss_base_score, max_cve_score or 0.0)
-
-        # If no CVE data, use conservative estimate
-        if max_score == 0.0:
-            max_score = 5.0  # Medium impact estimate
-
-        # Bonus for multiple CVEs (increased attack surface)
-        if cve_count > 0:
-            # Cap at +1.0 bonus
-            bonus = min(1.0, cve_count * 0.2)
-            max_score = min(10.0, max_score + bonus)
-
-        return max_score
+        return _impact_core(cvss_base_score, max_cve_score or 0.0, cve_count)
 
     def _calculate_lineage_score(self, path: List[str]) -> float:
         """
@@ -285,14 +327,7 @@ class PathThreatScorer:
         - Medium paths (4-6 hops): Medium score (6-8)
         - Long paths (7+ hops): Lower score (3-6)
         """
-        length = len(path)
-
-        if length <= 3:
-            return 9.5 - (length - 1) * 0.5  # 9.5, 9.0, 8.5
-        elif length <= 6:
-            return 7.0 - (length - 3) * 0.5  # 7.0, 6.5, 6.0
-        else:
-            return max(3.0, 6.0 - (length - 6) * 0.3)  # Decreases slowly
+        return _lineage_core(float(len(path)))
 
     def _calculate_confidence(self, z3_confidence: float, is_exploitable: bool) -> float:
         """
@@ -301,23 +336,18 @@ class PathThreatScorer:
         - Z3 verification provides high confidence
         - Confidence = z3_confidence * 10 if exploitable, 0 if not
         """
-        if not is_exploitable:
-            return 0.0
+        return _confidence_core(z3_confidence, is_exploitable)
 
-        return min(10.0, z3_confidence * 10.0)
+    # Threat level bins: bisect_right on the thresholds indexes the level
+    # tuple directly; a zero score is special-cased to INFORMATIONAL
+    _LEVEL_THRESHOLDS = (4.0, 7.0, 9.0)
+    _LEVELS = (ThreatLevel.LOW, ThreatLevel.MEDIUM, ThreatLevel.HIGH, ThreatLevel.CRITICAL)
 
     def _score_to_threat_level(self, score: float) -> ThreatLevel:
         """Map score to threat level."""
-        if score >= 9.0:
-            return ThreatLevel.CRITICAL
-        elif score >= 7.0:
-            return ThreatLevel.HIGH
-        elif score >= 4.0:
-            return ThreatLevel.MEDIUM
-        elif score > 0.0:
-            return ThreatLevel.LOW
-        else:
+        if score <= 0.0:
             return ThreatLevel.INFORMATIONAL
+        return self._LEVELS[bisect.bisect_right(self._LEVEL_THRESHOLDS, score)]
 
     def _generate_recommendations(
         self,
@@ -327,45 +357,39 @@ class PathThreatScorer:
         cve_count: int,
     ) -> List[str]:
         """Generate security recommendations based on threat assessment."""
-        recommendations = []
-
         if not is_exploitable:
-            recommendations.append("No immediate action required - path not exploitable.")
-            return recommendations
+            return [_REC_NOT_EXPLOITABLE]
+
+        recommendations = []
 
         # Recommend segmentation/isolation
         if len(path) > 4:
-            recommendations.append(
-                f"Consider network segmentation: Break path by isolating {path[len(path)//2]}"
-            )
+            recommendations.append(_REC_SEGMENT.format(node=path[len(path) // 2]))
 
         # Specific target recommendations
         target = path[-1] if path else "unknown"
-        if target in ["database", "secrets", "admin"]:
-            recommendations.append(
-                f"Increase access controls on {target}: Implement MFA and least-privilege IAM"
-            )
+        if target in _SENSITIVE_TARGETS:
+            recommendations.append(_REC_ACCESS.format(target=target))
 
         # CVE-specific recommendations
         if cve_count > 0:
-            recommendations.append(
-                f"Review {cve_count} associated CVEs and apply patches"
-            )
+            recommendations.append(_REC_CVES.format(count=cve_count))
         elif cvss_score and cvss_score >= 7.0:
-            recommendations.append(
-                "High CVSS score detected - prioritize remediation"
-            )
+            recommendations.append(_REC_HIGH_CVSS)
 
         # General hardening
-        recommendations.append(
-            "Implement detective controls (CloudTrail, VPC Flow Logs)"
-        )
+        recommendations.append(_REC_HARDENING)
 
         return recommendations
 
     def _path_to_id(self, path: List[str]) -> str:
         """Convert path to unique ID."""
-        return "|".join(path)
+        key = tuple(path)
+        path_id = self._id_cache.get(key)
+        if path_id is None:
+            path_id = sys.intern("|".join(path))
+            self._id_cache[key] = path_id
+        return path_id
 
     def score_multiple_paths(
         self,
@@ -380,22 +404,136 @@ class PathThreatScorer:
         Returns:
             Sorted list of PathThreatScore (highest risk first)
         """
-        scores = []
-
-        for path_data in paths:
-            score = self.score_path(
-                path=path_data.get("path", []),
-                is_exploitable=path_data.get("is_exploitable", False),
-                cvss_base_score=path_data.get("cvss_base_score"),
-                z3_confidence=path_data.get("z3_confidence", 1.0),
-                cve_count=path_data.get("cve_count", 0),
-                max_cve_score=path_data.get("max_cve_score"),
-                has_authentication_bypass=path_data.get("has_authentication_bypass", False),
-                has_privilege_escalation=path_data.get("has_privilege_escalation", False),
-            )
-            scores.append(score)
+        # One vectorized pass computes every overall score; the stable
+        # descending index sort matches the ordering the old per-path
+        # loop plus list.sort produced
+        return self.score_multiple_paths_vectorized(paths)
+
+    @staticmethod
+    def batch_to_json(scores: List[PathThreatScore]) -> bytes:
+        """Serialize a list of scores as one JSON array in a single pass.
 
-        # Sort by threat score (highest first)
-        scores.sort(key=lambda x: x.overall_score, reverse=True)
+        One serializer invocation over the whole batch amortizes setup
+        cost versus encoding each score separately and joining.
+        """
+        payload = [score.to_dict() for score in scores]
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload).encode("utf-8")
 
-        return scores
+    def score_multiple_paths_vectorized(
+        self,
+        paths: List[Dict],
+        top_k: Optional[int] = None,
+    ) -> List[PathThreatScore]:
+        """
+        Score a large batch of paths with NumPy, materializing only the top K.
+
+        The path attributes are first pulled into parallel columns (one
+        array per field), then all four component scores and the weighted
+        overall score are computed with whole-array expressions - the hot
+        arithmetic runs in C loops instead of one Python call chain per
+        path. Full PathThreatScore objects (components, recommendations)
+        are only built for the `top_k` highest-scoring paths, so ranking
+        thousands of paths allocates a handful of result objects.
+
+        Args:
+            paths: List of dicts with path data (same keys as score_path)
+            top_k: Number of top results to materialize (None = all)
+
+        Returns:
+            Sorted list of PathThreatScore (highest risk first)
+        """
+        n = len(paths)
+        if n == 0:
+            return []
+
+        excl = np.fromiter(
+            (bool(p.get("is_exploitable", False)) for p in paths), dtype=bool, count=n
+        )
+        plen = np.fromiter(
+            (len(p.get("path", [])) for p in paths), dtype=np.float64, count=n
+        )
+        cvss = np.fromiter(
+            (p.get("cvss_base_score") or 0.0 for p in paths), dtype=np.float64, count=n
+        )
+        z3c = np.fromiter(
+            (p.get("z3_confidence", 1.0) for p in paths), dtype=np.float64, count=n
+        )
+        cve_count = np.fromiter(
+            (p.get("cve_count", 0) for p in paths), dtype=np.float64, count=n
+        )
+        max_cve = np.fromiter(
+            (p.get("max_cve_score") or 0.0 for p in paths), dtype=np.float64, count=n
+        )
+        auth = np.fromiter(
+            (bool(p.get("has_authentication_bypass", False)) for p in paths),
+            dtype=bool, count=n,
+        )
+        privesc = np.fromiter(
+            (bool(p.get("has_privilege_escalation", False)) for p in paths),
+            dtype=bool, count=n,
+        )
+
+        # Exploitability: mirror of _calculate_exploitability
+        expl = np.maximum(3.5, 6.0 - np.maximum(0.0, (plen - 1.0) * 0.5))
+        expl += auth * 1.5 + privesc * 1.0
+        expl = np.where(excl, np.minimum(10.0, expl), 0.0)
+
+        # Impact: mirror of _calculate_impact
+        impact = np.maximum(cvss, max_cve)
+        impact = np.where(impact == 0.0, 5.0, impact)
+        impact = np.where(
+            cve_count > 0,
+            np.minimum(10.0, impact + np.minimum(1.0, cve_count * 0.2)),
+            impact,
+        )
+
+        # Lineage: mirror of the piecewise _calculate_lineage_score
+        lineage = np.where(
+            plen <= 3,
+            9.5 - (plen - 1.0) * 0.5,
+            np.where(
+                plen <= 6,
+                7.0 - (plen - 3.0) * 0.5,
+                np.maximum(3.0, 6.0 - (plen - 6.0) * 0.3),
+            ),
+        )
+
+        # Confidence: mirror of _calculate_confidence
+        confidence = np.where(excl, np.minimum(10.0, z3c * 10.0), 0.0)
+
+        # Weighted sum as a matrix-vector product: BLAS fuses the four
+        # multiply-adds per row instead of allocating three temporaries
+        comps = np.column_stack((expl, impact, lineage, confidence))
+        weight_vec = np.array([
+            self.WEIGHTS["exploitability"],
+            self.WEIGHTS["impact"],
+            self.WEIGHTS["lineage"],
+            self.WEIGHTS["confidence"],
+        ])
+        overall = comps @ weight_vec
+        np.clip(overall, 0.0, 10.0, out=overall)
+
+        # Materialize only the winners: argpartition is O(n) for the top-k
+        # selection, then the k survivors get the full scalar treatment
+        # (components, recommendations) and an exact descending sort
+        if top_k is not None and top_k < n:
+            selected = np.argpartition(-overall, top_k)[:top_k]
+        else:
+            selected = np.arange(n)
+        selected = selected[np.argsort(-overall[selected], kind="stable")]
+
+        return [
+            self.score_path(
+                path=paths[i].get("path", []),
+                is_exploitable=paths[i].get("is_exploitable", False),
+                cvss_base_score=paths[i].get("cvss_base_score"),
+                z3_confidence=paths[i].get("z3_confidence", 1.0),
+                cve_count=paths[i].get("cve_count", 0),
+                max_cve_score=paths[i].get("max_cve_score"),
+                has_authentication_bypass=paths[i].get("has_authentication_bypass", False),
+                has_privilege_escalation=paths[i].get("has_privilege_escalation", False),
+            )
+            for i in selected
+        ]
@@ -9,16 +9,20 @@ from .z3_verifier import (
     Z3Verifier,
     PolicyToZ3Converter,
     ProofResult,
+    BatchVerificationResults,
     VerificationResult,
     verify_path,
     verify_paths,
+    select_strategy,
 )
 
 __all__ = [
     "Z3Verifier",
     "PolicyToZ3Converter",
     "ProofResult",
+    "BatchVerificationResults",
     "VerificationResult",
     "verify_path",
     "verify_paths",
+    "select_strategy",
 ]
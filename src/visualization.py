@@ -1,90 +1,210 @@
-import plotly.graph_objects as go
+import hashlib
+import logging
+import os
+import pickle
+
 import networkx as nx
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ForceAtlas2's Barnes-Hut approximation is O(n log n) per iteration
+# versus the O(n^2) force calculation in the exact layouts; optional
+try:
+    from fa2 import ForceAtlas2
+except ImportError:
+    ForceAtlas2 = None
+
+_LAYOUT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "secpolicy")
+
+# Above this size the dense Fruchterman-Reingold iterations in
+# spring_layout get slow and the layout quality degrades; Kamada-Kawai
+# minimizes its energy with L-BFGS and handles large graphs better
+_LARGE_GRAPH_NODES = 500
+
+# Above this size even the L-BFGS layouts crawl; use Barnes-Hut
+# ForceAtlas2 when the fa2 package is installed
+_HUGE_GRAPH_NODES = 1000
+
+
+def _compute_layout(graph):
+    """Pick a layout algorithm by graph size and compute positions."""
+    n = graph.number_of_nodes()
+    if n > _HUGE_GRAPH_NODES and ForceAtlas2 is not None:
+        fa2_layout = ForceAtlas2(barnesHutOptimize=True, barnesHutTheta=1.2,
+                                 verbose=False)
+        return fa2_layout.forceatlas2_networkx_layout(graph, iterations=100)
+    if n > _LARGE_GRAPH_NODES:
+        try:
+            return nx.kamada_kawai_layout(graph)
+        except ImportError:
+            # Kamada-Kawai needs scipy; fall back to the default layout
+            logger.warning("scipy not available, falling back to spring_layout")
+    return nx.spring_layout(graph, seed=42)
 
 
-def visualize_graph(graph, attack_paths=None, output_file="graph_visualization.html"):
+def _layout_positions(graph, use_cache=True):
+    """Layout positions, memoized to disk keyed by graph structure.
+
+    Layout computation dominates visualize_graph for larger graphs, and
+    the security graph rarely changes between runs; identical node/edge
+    sets reuse the pickled positions. Cache failures fall back to a fresh
+    layout computation.
     """
-    Visualize the security graph with optional highlighting of attack paths.
+    if not use_cache:
+        return _compute_layout(graph)
+
+    key = hashlib.sha256(
+        (repr(sorted(graph.nodes())) + repr(sorted(graph.edges()))).encode()
+    ).hexdigest()
+    cache_path = os.path.join(_LAYOUT_CACHE_DIR, f"layout_{key}.pkl")
+
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    pos = _compute_layout(graph)
+    try:
+        os.makedirs(_LAYOUT_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(pos, f)
+    except OSError as e:
+        logger.warning("Could not cache layout positions: %s", e)
+    return pos
+
+
+def _highlight_shapes(pos, attack_paths):
+    """Layout line shapes covering every edge of every attack path.
+
+    Shapes bypass the scatter layout pipeline - no point hit-testing and
+    no null-separator path breaking - and they live in the layout, so
+    swapping highlights never touches the edge/node traces.
+    """
+    shapes = []
+    for path in (attack_paths or []):
+        for i in range(len(path) - 1):
+            x0, y0 = pos[path[i]]
+            x1, y1 = pos[path[i + 1]]
+            shapes.append(dict(
+                type='line', x0=float(x0), y0=float(y0),
+                x1=float(x1), y1=float(y1),
+                line=dict(width=3, color='red'),
+                name='Attack Paths',
+                showlegend=not shapes,
+            ))
+    return shapes
+
+
+def _interleaved_segments(coords, pairs):
+    """(source idx, target idx) pairs -> NaN-separated x and y arrays."""
+    idx = np.array(pairs, dtype=np.intp).reshape(len(pairs), 2)
+    # One preallocated (E, 3) block per axis, filled column-wise; the
+    # final ravel is a view, so each axis costs exactly one allocation
+    out = np.empty((2, len(pairs), 3), dtype=np.float32)
+    out[:, :, 0] = coords[idx[:, 0]].T
+    out[:, :, 1] = coords[idx[:, 1]].T
+    out[:, :, 2] = np.nan
+    return out[0].ravel(), out[1].ravel()
+
+
+def build_figure(graph, attack_paths=None, min_scattergl_elements=1000,
+                 use_cache=True):
+    """Build the attack-path figure without any I/O.
+
+    The figure carries two traces - edges and nodes - while attack-path
+    highlights live in layout.shapes, so update_figure can swap them
+    without touching the traces.
 
     Args:
         graph: NetworkX DiGraph
         attack_paths: List of paths to highlight (optional)
-        output_file: Output HTML file name
+        min_scattergl_elements: Render with WebGL (Scattergl) when the
+            graph has at least this many nodes plus edges; smaller
+            graphs keep the sharper SVG renderer
+        use_cache: Reuse disk-cached layout positions for an unchanged graph
+
+    Returns:
+        go.Figure with traces [edges, nodes] and highlight shapes
     """
+    # Imported here so API workers and CLI runs that never visualize
+    # don't pay plotly's several-hundred-millisecond import at startup
+    import plotly.graph_objects as go
+
+    # WebGL scales to thousands of elements where SVG becomes CPU-bound
+    # in the browser; the trace kwargs are identical between the two
+    use_webgl = graph.number_of_nodes() + graph.number_of_edges() >= min_scattergl_elements
+    scatter_cls = go.Scattergl if use_webgl else go.Scatter
+
     # Create positions for nodes
-    pos = nx.spring_layout(graph, seed=42)
-
-    # Prepare node data
-    node_x = []
-    node_y = []
-    node_text = []
-    node_color = []
-
-    for node in graph.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        node_text.append(f"{node}<br>Type: {graph.nodes[node].get('type', 'unknown')}")
-        # Color nodes: red for critical, blue for others
-        if graph.nodes[node].get('criticality') == 'high':
-            node_color.append('red')
-        else:
-            node_color.append('lightblue')
-
-    # Prepare edge data
-    edge_x = []
-    edge_y = []
-    edge_text = []
-
-    for edge in graph.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
-        edge_type = graph.edges[edge].get('type', 'unknown')
-        edge_text.append(f"{edge[0]} -> {edge[1]}<br>Type: {edge_type}")
-
-    # Highlight attack paths if provided
-    highlight_edge_x = []
-    highlight_edge_y = []
-    if attack_paths:
-        for path in attack_paths:
-            for i in range(len(path) - 1):
-                x0, y0 = pos[path[i]]
-                x1, y1 = pos[path[i + 1]]
-                highlight_edge_x.extend([x0, x1, None])
-                highlight_edge_y.extend([y0, y1, None])
-
-    # Create figure
-    fig = go.Figure()
-
-    # Add edges
-    fig.add_trace(go.Scatter(
+    pos = _layout_positions(graph, use_cache=use_cache)
+
+    # Pull all coordinates into one array; plotly accepts arrays directly
+    # and NaN breaks a line trace the same way None does, so the x0,x1,gap
+    # interleaving becomes a single column_stack instead of a Python loop
+    # float32 halves the serialized payload, and plotly emits ndarrays as
+    # compact typed arrays instead of verbose JSON number lists; screen
+    # coordinates don't need double precision
+    nodes = list(graph.nodes())
+    node_to_idx = {node: i for i, node in enumerate(nodes)}
+    coords = np.array([pos[node] for node in nodes],
+                      dtype=np.float32).reshape(len(nodes), 2)
+    node_x = coords[:, 0]
+    node_y = coords[:, 1]
+
+    # One fused pass over the adjacency structure gathers node attributes
+    # and outgoing edges together: each node's attribute dict and index
+    # are resolved once and reused for all of its edges, instead of
+    # separate nodes() and edges() traversals re-doing the lookups.
+    # Hover text is assembled in the browser from hovertemplate plus raw
+    # per-node/per-edge fields, instead of shipping N preformatted strings
+    node_types = []
+    node_crits = []
+    edge_pairs = []
+    edge_fields = []
+    for u, nbrs in graph.adjacency():
+        attrs = graph.nodes[u]
+        node_types.append(attrs.get('type', 'unknown'))
+        node_crits.append(attrs.get('criticality', 'normal'))
+        u_idx = node_to_idx[u]
+        for v, edata in nbrs.items():
+            edge_pairs.append((u_idx, node_to_idx[v]))
+            edge_fields.append((u, v, edata.get('type', 'unknown')))
+
+    # Color nodes: red for critical, blue for others - one vectorized
+    # comparison over the criticality column instead of a per-node branch
+    node_color = np.where(np.array(node_crits) == 'high',
+                          'red', 'lightblue').tolist()
+
+    edge_x, edge_y = _interleaved_segments(coords, edge_pairs)
+
+    # Each edge contributes three points (x0, x1, gap), so its hover
+    # fields repeat threefold to stay aligned with the coordinates
+    edge_customdata = np.repeat(
+        np.array(edge_fields, dtype=object).reshape(len(edge_fields), 3),
+        3, axis=0
+    )
+
+    # Build all traces up front so the figure is constructed in one shot;
+    # incremental add_trace/update_layout revalidates figure state each call
+    edge_trace = scatter_cls(
         x=edge_x, y=edge_y,
         line=dict(width=0.5, color='#888'),
-        hoverinfo='text',
-        text=edge_text,
+        customdata=edge_customdata,
+        hovertemplate='%{customdata[0]} -> %{customdata[1]}'
+                      '<br>Type: %{customdata[2]}<extra></extra>',
         mode='lines',
         name='Edges'
-    ))
-
-    # Add highlighted paths
-    if attack_paths:
-        fig.add_trace(go.Scatter(
-            x=highlight_edge_x, y=highlight_edge_y,
-            line=dict(width=3, color='red'),
-            hoverinfo='text',
-            mode='lines',
-            name='Attack Paths'
-        ))
-
-    # Add nodes
-    fig.add_trace(go.Scatter(
+    )
+
+    node_trace = scatter_cls(
         x=node_x, y=node_y,
         mode='markers+text',
-        text=[node for node in graph.nodes()],
+        text=nodes,
         textposition="top center",
-        hoverinfo='text',
+        customdata=node_types,
+        hovertemplate='%{text}<br>Type: %{customdata}<extra></extra>',
         textfont=dict(size=10),
         marker=dict(
             size=20,
@@ -92,18 +212,80 @@ def visualize_graph(graph, attack_paths=None, output_file="graph_visualization.h
             line_width=2
         ),
         name='Nodes'
-    ))
+    )
 
-    # Update layout
-    fig.update_layout(
+    layout = go.Layout(
         title="Security Policy Attack Path Graph",
         showlegend=True,
         hovermode='closest',
         margin=dict(b=20, l=5, r=5, t=40),
         xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        # Attack-path highlights render as layout shapes, keeping them
+        # out of the scatter pipeline and independent of the traces
+        shapes=_highlight_shapes(pos, attack_paths)
     )
 
-    # Save to HTML
-    fig.write_html(output_file)
-    print(f"Visualization saved to {output_file}")
\ No newline at end of file
+    return go.Figure(data=[edge_trace, node_trace], layout=layout)
+
+
+def update_figure(fig, graph, attack_paths, use_cache=True):
+    """Refresh only the highlight shapes on an already-built figure.
+
+    Node positions are stable (and disk-cached), so when just the attack
+    paths change there is no need to rebuild the edge and node traces -
+    one batched shape swap is the Plotly.react-style minimal redraw.
+
+    Args:
+        fig: Figure previously returned by build_figure
+        graph: The same NetworkX DiGraph the figure was built from
+        attack_paths: New list of paths to highlight (may be empty)
+        use_cache: Reuse disk-cached layout positions
+
+    Returns:
+        The same figure, mutated in place
+    """
+    pos = _layout_positions(graph, use_cache=use_cache)
+    with fig.batch_update():
+        fig.layout.shapes = _highlight_shapes(pos, attack_paths)
+    return fig
+
+
+def visualize_graph(graph, attack_paths=None, output_file="graph_visualization.html",
+                    min_scattergl_elements=1000, return_fig=False, use_cache=True):
+    """
+    Visualize the security graph with optional highlighting of attack paths.
+
+    Args:
+        graph: NetworkX DiGraph
+        attack_paths: List of paths to highlight (optional)
+        output_file: Output HTML file name
+        min_scattergl_elements: Render with WebGL (Scattergl) when the
+            graph has at least this many nodes plus edges; smaller
+            graphs keep the sharper SVG renderer
+        return_fig: Return the Figure instead of writing HTML
+        use_cache: Reuse disk-cached layout positions for an unchanged graph
+
+    Returns:
+        go.Figure when return_fig is True, otherwise None; always None
+        when the SECPOLICY_DISABLE_VIZ environment variable is set
+    """
+    # Escape hatch for CI and tests: skip layout, figure build, and the
+    # write_html syscalls entirely
+    if os.environ.get('SECPOLICY_DISABLE_VIZ'):
+        return None
+
+    fig = build_figure(graph, attack_paths,
+                       min_scattergl_elements=min_scattergl_elements,
+                       use_cache=use_cache)
+
+    if return_fig:
+        # Callers who mutate the figure further should batch their edits:
+        #     with fig.batch_update(): ...
+        return fig
+
+    # Save to HTML; loading plotly.js from the CDN keeps the file a few
+    # KB instead of embedding the ~3MB bundle in every visualization
+    fig.write_html(output_file, include_plotlyjs='cdn',
+                   config={'responsive': True})
+    print(f"Visualization saved to {output_file}")
@@ -2,56 +2,78 @@
 Pytest configuration and shared fixtures for all tests.
 """
 
+import os
+
 import pytest
+from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from unittest.mock import patch
-import tempfile
-import os
+from sqlalchemy.pool import StaticPool
 
 from src.api import app, get_db
 from src.database import Base
 import src.database
 import src.api
 
+# No test should write visualization HTML; any codepath that reaches
+# visualize_graph becomes a no-op instead of an I/O hit
+os.environ.setdefault('SECPOLICY_DISABLE_VIZ', '1')
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_test_db():
+
+@pytest.fixture(scope="session")
+def test_engine():
     """
-    Auto-use fixture that sets up test database for ALL tests.
-    Creates a temporary file-based SQLite database and overrides both get_db
-    dependency injection and SessionLocal for background tasks.
-    Runs for each test function.
+    Session-scoped in-memory SQLite engine with tables created once.
+    StaticPool keeps every connection on the same in-memory database,
+    so the schema survives across connections without any file I/O.
+
+    Safe under pytest-xdist (pytest -n auto): each worker is its own
+    process, so every worker builds a private in-memory engine and the
+    SessionLocal monkeypatching below never crosses worker boundaries.
     """
-    # Create a temporary file-based SQLite database
-    temp_db_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.db')
-    temp_db_path = temp_db_file.name
-    temp_db_file.close()
-    
-    # Create SQLite engine
-    test_engine = create_engine(
-        f"sqlite:///{temp_db_path}",
+    engine = create_engine(
+        "sqlite://",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
         echo=False
     )
-    
+
     # Enable foreign keys for SQLite
-    @event.listens_for(test_engine, "connect")
+    @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
-    
-    # Create all tables
-    Base.metadata.create_all(bind=test_engine)
-    
-    # Create session factory bound to our test engine
+
+    Base.metadata.create_all(bind=engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_test_db(test_engine):
+    """
+    Auto-use fixture that isolates each test in a rolled-back transaction.
+    Opens one connection with an outer transaction, binds all sessions to
+    it with savepoint-joining (so application commits stay inside the
+    outer transaction), and rolls everything back on teardown - no
+    per-test schema creation or teardown needed.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+
+    # Sessions join the outer transaction via savepoints; session.commit()
+    # releases the savepoint and opens a new one, leaving the outer
+    # transaction (and the rollback below) in control
     TestingSessionLocal = sessionmaker(
         autocommit=False,
         autoflush=False,
-        bind=test_engine
+        bind=connection,
+        join_transaction_mode="create_savepoint"
     )
-    
+
     # Override get_db dependency to use test database
     def override_get_db():
         db = TestingSessionLocal()
@@ -59,33 +81,39 @@ def setup_test_db():
             yield db
         finally:
             db.close()
-    
+
     # Override FastAPI dependency injection
     app.dependency_overrides[get_db] = override_get_db
-    
+
     # Also patch SessionLocal in both database and api modules to use test session factory
     # This ensures background tasks and direct calls use the test database
     original_session_local = src.database.SessionLocal
     original_api_session_local = src.api.SessionLocal
-    
+
     src.database.SessionLocal = TestingSessionLocal
     src.api.SessionLocal = TestingSessionLocal
-    
+
     yield
-    
+
     # Clean up: restore original SessionLocal
     src.database.SessionLocal = original_session_local
     src.api.SessionLocal = original_api_session_local
-    
+
     # Remove dependency overrides
     app.dependency_overrides.clear()
-    
-    # Drop all tables and dispose engine
-    Base.metadata.drop_all(bind=test_engine)
-    test_engine.dispose()
-    
-    # Delete temp file
-    try:
-        os.unlink(temp_db_path)
-    except:
-        pass
+
+    # Discard everything the test wrote
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Shared FastAPI test client, constructed once for the whole session.
+    Dependency overrides are resolved per request, so the per-test DB
+    fixture keeps tests isolated without rebuilding the ASGI stack.
+    Tests that override other dependencies should restore
+    app.dependency_overrides in a finally block.
+    """
+    return TestClient(app)
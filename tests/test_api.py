@@ -3,22 +3,10 @@ Tests for REST API endpoints.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from src.api import app, get_db
 from src.database import Base, ServiceAccount, Policy, AnalysisJob, AttackPath, PolicyChange, AnalysisCache
 
-
-# ============================================================================
-# Test Fixtures
-# ============================================================================
-
-@pytest.fixture
-def client(setup_test_db):
-    """FastAPI test client with auto-configured test database."""
-    return TestClient(app)
+# The shared `client` fixture lives in conftest.py (session-scoped).
 
 
 # ============================================================================
@@ -227,6 +227,29 @@ class TestBuildGraph:
             assert graph1.nodes[node] == graph2.nodes[node]
 
 
+class TestBuildGraphCache:
+    """Test on-disk graph caching."""
+
+    def test_cached_build_matches_fresh_build(self):
+        """Cached graph should be identical to a freshly built one."""
+        fresh = build_graph(use_cache=False)
+        build_graph()  # populate cache
+        cached = build_graph()
+
+        assert cached.number_of_nodes() == fresh.number_of_nodes()
+        assert cached.number_of_edges() == fresh.number_of_edges()
+
+        for node in fresh.nodes():
+            assert cached.nodes[node] == fresh.nodes[node]
+
+    def test_cache_disabled_still_builds(self):
+        """use_cache=False should always rebuild from data files."""
+        graph = build_graph(use_cache=False)
+
+        assert isinstance(graph, nx.DiGraph)
+        assert graph.number_of_nodes() > 0
+
+
 class TestGraphIntegrity:
     """Test graph integrity and consistency."""
     
@@ -320,3 +320,38 @@ class TestEdgeCases:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+# ============================================================================
+# PREPARED CONDITIONS
+# ============================================================================
+
+class TestPreparedConditions:
+    """Test the compile-once-evaluate-many prepare() API."""
+
+    def test_prepared_matches_is_satisfied(self):
+        """A prepared checker should agree with is_satisfied."""
+        evaluator = ConditionEvaluator({"source_ip": "192.168.1.100",
+                                        "time_of_day": "business_hours"})
+        condition = {
+            "IpAddress:source_ip": "192.168.1.0/24",
+            "StringEquals:time_of_day": "business_hours"
+        }
+        check = evaluator.prepare(condition)
+        assert check() == evaluator.is_satisfied(condition) == True
+
+    def test_prepared_none_condition(self):
+        """No condition is always satisfied."""
+        evaluator = ConditionEvaluator({})
+        assert evaluator.prepare(None)() == True
+
+    def test_prepared_unknown_operator(self):
+        """Unknown operators fail at preparation, not per call."""
+        evaluator = ConditionEvaluator({"key": "value"})
+        assert evaluator.prepare({"UnknownOperator:key": "value"})() == False
+
+    def test_prepared_failing_condition(self):
+        """A prepared checker should report unsatisfied conditions."""
+        evaluator = ConditionEvaluator({"source_ip": "external"})
+        check = evaluator.prepare({"StringEquals:source_ip": "internal"})
+        assert check() == False
@@ -1,5 +1,6 @@
 import pytest
 import networkx as nx
+import numpy as np
 from src.analysis.find_paths import (
     AttackPathAnalyzer,
     find_attack_paths,
@@ -291,6 +292,82 @@ class TestMetrics:
                or final_metrics["evaluation_time"] > initial_metrics["evaluation_time"]
 
 
+class TestRawPathResults:
+    """Test the structure-of-arrays raw query interface."""
+
+    def test_raw_matches_decoded(self, simple_graph):
+        """Raw buffers should decode to the same paths as the list API."""
+        context = {"source_ip": "internal"}
+        analyzer = AttackPathAnalyzer(simple_graph, context)
+
+        flat, lens = analyzer.find_attack_paths_raw("internet", "database")
+        decoded = analyzer.decode_paths(flat, lens)
+        paths = analyzer.find_attack_paths("internet", "database", use_cache=False)
+
+        assert sorted(decoded) == sorted(paths)
+        assert int(lens.sum()) == len(flat)
+
+    def test_raw_invalid_node(self, simple_graph):
+        """Unknown nodes should raise ValueError like the list API."""
+        analyzer = AttackPathAnalyzer(simple_graph, {})
+        with pytest.raises(ValueError):
+            analyzer.find_attack_paths_raw("nonexistent", "database")
+
+
+@pytest.fixture
+def chain_graph():
+    """A 40-node chain; node indices past 31 exercise the wide bitmap."""
+    G = nx.DiGraph()
+    for i in range(40):
+        G.add_node(f"node_{i}", type="host", criticality="normal")
+    for i in range(39):
+        G.add_edge(f"node_{i}", f"node_{i + 1}", type="network",
+                   rule_name=f"hop_{i}")
+    return G
+
+
+class TestBatchQueries:
+    """Test the shared-memory batch query interface."""
+
+    def test_batch_matches_serial(self, chain_graph):
+        """Batch results should equal per-pair serial queries."""
+        analyzer = AttackPathAnalyzer(chain_graph, {}, max_depth=10)
+        # More than two pairs so the process pool actually spins up
+        pairs = [(f"node_{i}", f"node_{i + 5}") for i in (0, 17, 30, 34)]
+
+        results = analyzer.find_attack_paths_batch(pairs)
+
+        assert set(results) == set(pairs)
+        for source, target in pairs:
+            serial = analyzer.find_attack_paths(source, target,
+                                                use_cache=False)
+            assert results[(source, target)] == serial
+
+    def test_batch_invalid_node(self, chain_graph):
+        """Unknown nodes should raise ValueError like the list API."""
+        analyzer = AttackPathAnalyzer(chain_graph, {})
+        with pytest.raises(ValueError):
+            analyzer.find_attack_paths_batch([("node_0", "nonexistent")])
+
+    def test_batch_from_csr(self):
+        """Batch queries should work on CSR-direct analyzers too."""
+        n = 40
+        nodes = [f"node_{i}" for i in range(n)]
+        indptr = np.arange(n + 1, dtype=np.int64)
+        indptr[-1] = n - 1
+        indices = np.arange(1, n, dtype=np.int32)
+        analyzer = AttackPathAnalyzer.from_csr(nodes, indptr, indices,
+                                               max_depth=10)
+        pairs = [(f"node_{i}", f"node_{i + 5}") for i in (0, 17, 30, 34)]
+
+        results = analyzer.find_attack_paths_batch(pairs)
+
+        for source, target in pairs:
+            serial = analyzer.find_attack_paths(source, target,
+                                                use_cache=False)
+            assert results[(source, target)] == serial
+
+
 class TestBackwardCompatibility:
     """Test backward compatibility with old function interface."""
     
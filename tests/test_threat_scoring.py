@@ -131,6 +131,33 @@ class TestCVSSCalculator:
         )
         assert none_score.severity_color == "gray"
 
+    def test_cvss_batch_matches_scalar(self):
+        """Batch scoring should agree with the scalar API row by row."""
+        calculator = CVSSCalculator()
+
+        rows = [
+            ("N", "L", "N", "N", "U", "H", "H", "H"),
+            ("L", "H", "H", "R", "U", "L", "N", "N"),
+            ("N", "L", "N", "N", "C", "H", "H", "H"),
+            ("A", "L", "L", "N", "U", "N", "N", "N"),
+        ]
+        columns = list(zip(*rows))
+        batch = calculator.calculate_base_scores_batch(*columns)
+
+        for row, batch_score in zip(rows, batch):
+            assert batch_score == pytest.approx(
+                calculator.calculate_base_score(*row).base_score
+            )
+
+    def test_cvss_batch_invalid_code(self):
+        """Batch scoring should reject invalid metric codes."""
+        calculator = CVSSCalculator()
+
+        with pytest.raises(ValueError):
+            calculator.calculate_base_scores_batch(
+                ["X"], ["L"], ["N"], ["N"], ["U"], ["H"], ["H"], ["H"]
+            )
+
 
 class TestThreatAssessment:
     """Test threat assessment from attack path characteristics."""
@@ -283,6 +310,41 @@ class TestPathThreatScorer:
         assert results[0].overall_score >= results[1].overall_score
         assert results[0].overall_score >= results[2].overall_score
 
+    def test_score_multiple_paths_vectorized_matches_scalar(self):
+        """Vectorized batch scoring agrees with the per-path loop."""
+        scorer = PathThreatScorer()
+
+        paths = [
+            {
+                "path": ["internet", "web", "db"],
+                "is_exploitable": True,
+                "cvss_base_score": 8.0,
+                "cve_count": 1,
+            },
+            {
+                "path": ["internal", "admin"],
+                "is_exploitable": True,
+                "cvss_base_score": 6.0,
+                "has_privilege_escalation": True,
+            },
+            {
+                "path": ["external", "locked"],
+                "is_exploitable": False,
+            },
+        ]
+
+        scalar = scorer.score_multiple_paths(paths)
+        vectorized = scorer.score_multiple_paths_vectorized(paths)
+
+        assert [s.path_id for s in vectorized] == [s.path_id for s in scalar]
+        for v, s in zip(vectorized, scalar):
+            assert v.overall_score == pytest.approx(s.overall_score)
+
+        # top_k only materializes the requested number of results
+        top = scorer.score_multiple_paths_vectorized(paths, top_k=1)
+        assert len(top) == 1
+        assert top[0].path_id == scalar[0].path_id
+
     def test_threat_level_mapping(self):
         """Test threat level to score mapping."""
         scorer = PathThreatScorer()